@@ -195,7 +195,7 @@ static void draw_pentacube_frame(void)
     
     lv_opa_t opacity = (lv_opa_t)(LV_OPA_COVER * morphing_progress);
     
-    const float (*verts)[3] = (const float (*)[3])pentacube->vertices;
+    const uint8_t (*verts)[3] = (const uint8_t (*)[3])pentacube->vertices;
     
     float *rotated_verts = lv_mem_alloc(pentacube->vertex_count * 3 * sizeof(float));
     int *screen_coords = lv_mem_alloc(pentacube->vertex_count * 2 * sizeof(int));
@@ -325,7 +325,7 @@ static void animation_timer_cb(lv_timer_t *timer)
 static float get_pentacube_center_x(int pentacube_idx)
 {
     const pentacube_data_t *p = &pentacube_data[pentacube_idx];
-    const float (*verts)[3] = (const float (*)[3])p->vertices;
+    const uint8_t (*verts)[3] = (const uint8_t (*)[3])p->vertices;
     float sum_x = 0.0f;
     int vertex_count = p->vertex_count;
     
@@ -1,1906 +1,762 @@
 // Auto-generated pentacube data from Blender export
 // DO NOT EDIT - regenerate from run_in_blender.py
+// Source hash: 0f66d6a31633cc883b00fc288a3bbc9ccf2a46c0
 #include "pentacubes.h"
 
-static const float vertices_A[][3] = {
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 0.0f, 0.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 0.0f},
-    {2.0f, 1.0f, 0.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {3.0f, 1.0f, 0.0f},
-    {3.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 0.0f},
-    {1.0f, 1.0f, 1.0f},
-    {0.0f, 3.0f, 1.0f},
-    {0.0f, 3.0f, 0.0f},
-    {1.0f, 2.0f, 1.0f},
-    {1.0f, 3.0f, 1.0f},
-    {1.0f, 3.0f, 0.0f},
-};
-
-static const float vertices_B[][3] = {
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 0.0f, 0.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 0.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {2.0f, 2.0f, 0.0f},
-    {2.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 2.0f, 2.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 2.0f, 2.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 2.0f, 1.0f},
-    {1.0f, 2.0f, 1.0f},
-};
-
-static const float vertices_E[][3] = {
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 0.0f, 2.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 0.0f, 2.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 1.0f, 2.0f},
-    {0.0f, 1.0f, 0.0f},
-    {0.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 1.0f, 2.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 2.0f, 1.0f},
-    {3.0f, 2.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 2.0f, 2.0f},
-    {1.0f, 2.0f, 1.0f},
-};
-
-static const float vertices_E_p[][3] = {
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 0.0f, 2.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 1.0f, 2.0f},
-    {3.0f, 1.0f, 0.0f},
-    {3.0f, 2.0f, 0.0f},
-    {2.0f, 1.0f, 0.0f},
-    {2.0f, 2.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 1.0f, 2.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 2.0f, 1.0f},
-    {0.0f, 2.0f, 2.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 2.0f, 2.0f},
-    {2.0f, 2.0f, 1.0f},
-};
-
-static const float vertices_F[][3] = {
-    {3.0f, 1.0f, 0.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 0.0f},
-    {3.0f, 2.0f, 1.0f},
-    {0.0f, 3.0f, 0.0f},
-    {0.0f, 3.0f, 1.0f},
-    {1.0f, 3.0f, 0.0f},
-    {1.0f, 3.0f, 1.0f},
-    {1.0f, 2.0f, 0.0f},
-    {1.0f, 0.0f, 0.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 0.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 1.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 0.0f},
-    {0.0f, 1.0f, 1.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 1.0f},
-};
-
-static const float vertices_G[][3] = {
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 1.0f},
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 2.0f},
-    {3.0f, 1.0f, 0.0f},
-    {3.0f, 2.0f, 0.0f},
-    {2.0f, 1.0f, 0.0f},
-    {2.0f, 2.0f, 0.0f},
-    {1.0f, 2.0f, 1.0f},
-    {1.0f, 2.0f, 2.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 0.0f, 2.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 2.0f, 2.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 1.0f, 2.0f},
-    {2.0f, 2.0f, 1.0f},
-};
-
-static const float vertices_G_p[][3] = {
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 1.0f, 2.0f},
-    {3.0f, 0.0f, 1.0f},
-    {3.0f, 0.0f, 2.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 1.0f, 2.0f},
-    {0.0f, 1.0f, 0.0f},
-    {0.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {2.0f, 2.0f, 1.0f},
-    {2.0f, 2.0f, 2.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 2.0f, 2.0f},
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 1.0f, 2.0f},
-    {1.0f, 2.0f, 1.0f},
-};
-
-static const float vertices_H[][3] = {
-    {0.0f, 1.0f, 0.0f},
-    {0.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 0.0f},
-    {2.0f, 2.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 2.0f, 1.0f},
-    {3.0f, 2.0f, 2.0f},
-    {3.0f, 2.0f, 1.0f},
-    {1.0f, 1.0f, 2.0f},
-    {1.0f, 2.0f, 2.0f},
-    {1.0f, 2.0f, 1.0f},
-    {3.0f, 0.0f, 2.0f},
-    {2.0f, 0.0f, 2.0f},
-    {2.0f, 1.0f, 2.0f},
-    {3.0f, 0.0f, 1.0f},
-    {2.0f, 0.0f, 1.0f},
-};
-
-static const float vertices_H_p[][3] = {
-    {3.0f, 1.0f, 0.0f},
-    {3.0f, 2.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 2.0f, 1.0f},
-    {0.0f, 2.0f, 2.0f},
-    {0.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 2.0f},
-    {2.0f, 2.0f, 2.0f},
-    {2.0f, 2.0f, 1.0f},
-    {0.0f, 0.0f, 2.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 1.0f},
-    {1.0f, 0.0f, 1.0f},
-};
-
-static const float vertices_I[][3] = {
-    {5.0f, 0.0f, 1.0f},
-    {5.0f, 1.0f, 1.0f},
-    {5.0f, 0.0f, 0.0f},
-    {5.0f, 1.0f, 0.0f},
-    {0.0f, 0.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 0.0f, 0.0f},
-    {0.0f, 1.0f, 0.0f},
-};
-
-static const float vertices_J[][3] = {
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {0.0f, 0.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {1.0f, 0.0f, 0.0f},
-    {0.0f, 0.0f, 0.0f},
-    {3.0f, 1.0f, 2.0f},
-    {1.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 2.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 2.0f, 2.0f},
-    {1.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {1.0f, 2.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {1.0f, 2.0f, 0.0f},
-    {0.0f, 2.0f, 0.0f},
-};
-
-static const float vertices_J_p[][3] = {
-    {2.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {3.0f, 1.0f, 1.0f},
-    {2.0f, 2.0f, 2.0f},
-    {3.0f, 2.0f, 2.0f},
-    {0.0f, 1.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-    {0.0f, 0.0f, 0.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 0.0f, 1.0f},
-    {3.0f, 1.0f, 0.0f},
-    {3.0f, 0.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-    {3.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 1.0f},
-    {3.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 2.0f},
-    {3.0f, 0.0f, 2.0f},
-};
-
-static const float vertices_K[][3] = {
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 2.0f, 1.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 2.0f, 2.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 2.0f},
-    {2.0f, 2.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 2.0f, 2.0f},
-    {1.0f, 2.0f, 2.0f},
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 2.0f, 1.0f},
-    {0.0f, 2.0f, 1.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {0.0f, 1.0f, 0.0f},
-    {0.0f, 2.0f, 0.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 2.0f},
-    {1.0f, 0.0f, 1.0f},
-    {0.0f, 0.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-};
-
-static const float vertices_L[][3] = {
-    {4.0f, 0.0f, 2.0f},
-    {4.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {3.0f, 0.0f, 1.0f},
-    {3.0f, 1.0f, 1.0f},
-    {4.0f, 0.0f, 0.0f},
-    {4.0f, 1.0f, 0.0f},
-    {3.0f, 0.0f, 0.0f},
-    {3.0f, 1.0f, 0.0f},
-};
-
-static const float vertices_M[][3] = {
-    {2.0f, 2.0f, 2.0f},
-    {2.0f, 2.0f, 1.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 2.0f, 2.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 2.0f, 2.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 2.0f, 1.0f},
-    {1.0f, 2.0f, 2.0f},
-    {1.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 0.0f},
-    {2.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {2.0f, 0.0f, 2.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 1.0f, 2.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-};
-
-static const float vertices_N[][3] = {
-    {0.0f, 0.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 2.0f},
-    {2.0f, 1.0f, 2.0f},
-    {4.0f, 0.0f, 0.0f},
-    {4.0f, 1.0f, 0.0f},
-    {4.0f, 0.0f, 1.0f},
-    {4.0f, 1.0f, 1.0f},
-    {1.0f, 0.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 0.0f, 1.0f},
-};
-
-static const float vertices_P[][3] = {
-    {0.0f, 0.0f, 0.0f},
-    {0.0f, 1.0f, 0.0f},
-    {3.0f, 0.0f, 2.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 0.0f, 1.0f},
-    {3.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 1.0f},
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 0.0f},
-    {2.0f, 1.0f, 0.0f},
-};
-
-static const float vertices_Q[][3] = {
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 2.0f, 1.0f},
-    {1.0f, 2.0f, 1.0f},
-    {2.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {2.0f, 0.0f, 2.0f},
-    {2.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 0.0f},
-    {0.0f, 1.0f, 0.0f},
-    {1.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 0.0f},
-};
-
-static const float vertices_R[][3] = {
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 2.0f, 2.0f},
-    {2.0f, 1.0f, 2.0f},
-    {1.0f, 2.0f, 2.0f},
-    {2.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 0.0f},
-    {2.0f, 2.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 0.0f},
-    {0.0f, 2.0f, 0.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 2.0f, 1.0f},
-    {1.0f, 2.0f, 1.0f},
-    {2.0f, 0.0f, 1.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 2.0f},
-    {1.0f, 0.0f, 2.0f},
-};
-
-static const float vertices_R_p[][3] = {
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 2.0f, 1.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 2.0f, 2.0f},
-    {1.0f, 1.0f, 2.0f},
-    {2.0f, 2.0f, 2.0f},
-    {1.0f, 2.0f, 1.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 1.0f},
-    {3.0f, 1.0f, 0.0f},
-    {3.0f, 2.0f, 0.0f},
-    {3.0f, 1.0f, 1.0f},
-    {3.0f, 2.0f, 1.0f},
-    {2.0f, 2.0f, 1.0f},
-    {1.0f, 0.0f, 1.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-    {1.0f, 0.0f, 2.0f},
-    {2.0f, 0.0f, 2.0f},
-};
-
-static const float vertices_S[][3] = {
-    {0.0f, 2.0f, 2.0f},
-    {0.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-    {3.0f, 1.0f, 2.0f},
-    {2.0f, 2.0f, 1.0f},
-    {2.0f, 1.0f, 0.0f},
-    {2.0f, 2.0f, 0.0f},
-    {3.0f, 1.0f, 0.0f},
-    {0.0f, 0.0f, 2.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 0.0f, 1.0f},
-    {3.0f, 2.0f, 2.0f},
-    {3.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-};
-
-static const float vertices_S_p[][3] = {
-    {3.0f, 2.0f, 2.0f},
-    {3.0f, 2.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 2.0f},
-    {1.0f, 2.0f, 1.0f},
-    {1.0f, 1.0f, 0.0f},
-    {1.0f, 2.0f, 0.0f},
-    {0.0f, 1.0f, 0.0f},
-    {3.0f, 0.0f, 2.0f},
-    {2.0f, 0.0f, 2.0f},
-    {2.0f, 0.0f, 1.0f},
-    {0.0f, 2.0f, 2.0f},
-    {0.0f, 2.0f, 0.0f},
-    {2.0f, 1.0f, 2.0f},
-    {3.0f, 0.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-};
-
-static const float vertices_T[][3] = {
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 0.0f, 0.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 0.0f, 0.0f},
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 1.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-    {2.0f, 1.0f, 0.0f},
-    {0.0f, 2.0f, 1.0f},
-    {0.0f, 2.0f, 0.0f},
-    {1.0f, 2.0f, 1.0f},
-    {1.0f, 2.0f, 0.0f},
-    {0.0f, 3.0f, 1.0f},
-    {0.0f, 3.0f, 0.0f},
-    {1.0f, 3.0f, 1.0f},
-    {1.0f, 3.0f, 0.0f},
-    {2.0f, 3.0f, 1.0f},
-    {2.0f, 3.0f, 0.0f},
-    {2.0f, 2.0f, 1.0f},
-    {2.0f, 2.0f, 0.0f},
-    {3.0f, 3.0f, 1.0f},
-    {3.0f, 3.0f, 0.0f},
-    {3.0f, 2.0f, 1.0f},
-    {3.0f, 2.0f, 0.0f},
-};
-
-static const float vertices_U[][3] = {
-    {0.0f, 0.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 0.0f, 0.0f},
-    {0.0f, 1.0f, 0.0f},
-    {2.0f, 0.0f, 3.0f},
-    {2.0f, 1.0f, 3.0f},
-    {0.0f, 0.0f, 3.0f},
-    {0.0f, 1.0f, 3.0f},
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 1.0f, 2.0f},
-    {2.0f, 0.0f, 0.0f},
-    {2.0f, 1.0f, 0.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-};
-
-static const float vertices_V[][3] = {
-    {1.0f, 0.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {0.0f, 0.0f, 0.0f},
-    {0.0f, 1.0f, 0.0f},
-    {3.0f, 0.0f, 3.0f},
-    {3.0f, 1.0f, 3.0f},
-    {3.0f, 0.0f, 2.0f},
-    {3.0f, 1.0f, 2.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 3.0f},
-    {0.0f, 1.0f, 3.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 1.0f, 2.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 1.0f, 2.0f},
-};
-
-static const float vertices_W[][3] = {
-    {3.0f, 0.0f, 0.0f},
-    {3.0f, 1.0f, 0.0f},
-    {2.0f, 0.0f, 0.0f},
-    {2.0f, 1.0f, 0.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-    {1.0f, 1.0f, 2.0f},
-    {2.0f, 0.0f, 3.0f},
-    {2.0f, 1.0f, 3.0f},
-    {0.0f, 0.0f, 3.0f},
-    {0.0f, 1.0f, 3.0f},
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {1.0f, 0.0f, 2.0f},
-    {3.0f, 0.0f, 2.0f},
-    {3.0f, 1.0f, 2.0f},
-    {2.0f, 0.0f, 2.0f},
-    {2.0f, 1.0f, 2.0f},
-};
-
-static const float vertices_X[][3] = {
-    {2.0f, 0.0f, 0.0f},
-    {2.0f, 1.0f, 0.0f},
-    {1.0f, 0.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {2.0f, 0.0f, 2.0f},
-    {2.0f, 1.0f, 2.0f},
-    {3.0f, 0.0f, 2.0f},
-    {3.0f, 1.0f, 2.0f},
-    {3.0f, 0.0f, 1.0f},
-    {3.0f, 1.0f, 1.0f},
-    {1.0f, 0.0f, 3.0f},
-    {1.0f, 1.0f, 3.0f},
-    {1.0f, 1.0f, 2.0f},
-    {2.0f, 0.0f, 3.0f},
-    {2.0f, 1.0f, 3.0f},
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 1.0f},
-    {0.0f, 1.0f, 1.0f},
-    {1.0f, 0.0f, 2.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 1.0f, 1.0f},
-};
-
-static const float vertices_Y[][3] = {
-    {4.0f, 1.0f, 1.0f},
-    {4.0f, 1.0f, 0.0f},
-    {4.0f, 2.0f, 1.0f},
-    {4.0f, 2.0f, 0.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 0.0f, 0.0f},
-    {2.0f, 0.0f, 1.0f},
-    {2.0f, 0.0f, 0.0f},
-    {0.0f, 1.0f, 1.0f},
-    {0.0f, 1.0f, 0.0f},
-    {1.0f, 1.0f, 1.0f},
-    {0.0f, 2.0f, 1.0f},
-    {0.0f, 2.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-    {2.0f, 1.0f, 0.0f},
-    {2.0f, 1.0f, 1.0f},
-};
-
-static const float vertices_Z[][3] = {
-    {2.0f, 0.0f, 3.0f},
-    {2.0f, 1.0f, 3.0f},
-    {2.0f, 0.0f, 2.0f},
-    {3.0f, 0.0f, 3.0f},
-    {3.0f, 1.0f, 3.0f},
-    {2.0f, 1.0f, 2.0f},
-    {3.0f, 0.0f, 1.0f},
-    {3.0f, 1.0f, 1.0f},
-    {0.0f, 0.0f, 2.0f},
-    {0.0f, 1.0f, 2.0f},
-    {0.0f, 0.0f, 0.0f},
-    {0.0f, 1.0f, 0.0f},
-    {1.0f, 0.0f, 1.0f},
-    {1.0f, 1.0f, 1.0f},
-    {1.0f, 0.0f, 0.0f},
-    {1.0f, 1.0f, 0.0f},
-};
-
-static const int edges_A[] = {
-    0, 1, 0, 2, 0, 14, 1, 4, 1, 10, 2, 3, 2, 4, 3, 5,
-    3, 6, 4, 5, 5, 8, 6, 7, 6, 8, 7, 9, 7, 17, 8, 9,
-    9, 11, 10, 13, 10, 14, 11, 17, 11, 19, 12, 13, 12, 14, 12, 15,
-    13, 16, 15, 16, 15, 18, 16, 19, 17, 18, 18, 19,
-};
-
-static const int edges_B[] = {
-    0, 1, 0, 2, 0, 3, 1, 8, 1, 15, 1, 17, 2, 4, 2, 5,
-    3, 4, 3, 8, 4, 6, 5, 6, 5, 17, 6, 7, 7, 8, 7, 12,
-    8, 11, 9, 10, 9, 11, 9, 13, 10, 12, 10, 14, 11, 12, 13, 14,
-    13, 15, 14, 16, 15, 16, 16, 17,
-};
-
-static const int edges_E[] = {
-    0, 1, 0, 2, 0, 10, 1, 3, 1, 11, 2, 3, 2, 4, 3, 5,
-    4, 5, 4, 12, 5, 13, 6, 7, 6, 8, 6, 16, 7, 9, 7, 17,
-    8, 9, 8, 10, 9, 18, 10, 11, 10, 18, 11, 16, 12, 13, 12, 14,
-    13, 15, 14, 15, 14, 18, 15, 17, 16, 17,
-};
-
-static const int edges_E_p[] = {
-    0, 1, 0, 2, 0, 10, 1, 3, 1, 11, 2, 3, 2, 4, 3, 5,
-    4, 5, 4, 12, 5, 13, 6, 7, 6, 8, 6, 16, 7, 9, 7, 17,
-    8, 9, 8, 10, 9, 18, 10, 11, 10, 18, 11, 16, 12, 13, 12, 14,
-    13, 15, 14, 15, 14, 18, 15, 17, 16, 17,
-};
-
-static const int edges_F[] = {
-    0, 1, 0, 2, 0, 14, 1, 3, 1, 15, 2, 3, 2, 8, 3, 19,
-    4, 5, 4, 6, 4, 16, 5, 7, 5, 17, 6, 7, 6, 8, 7, 19,
-    8, 19, 9, 10, 9, 12, 9, 18, 10, 11, 10, 13, 11, 17, 11, 18,
-    12, 13, 12, 14, 13, 15, 14, 15, 16, 17, 16, 18,
-};
-
-static const int edges_G[] = {
-    0, 1, 0, 4, 0, 10, 1, 5, 1, 11, 2, 3, 2, 4, 2, 12,
-    3, 5, 3, 13, 4, 5, 6, 7, 6, 8, 6, 14, 7, 9, 7, 15,
-    8, 9, 8, 16, 9, 18, 10, 11, 10, 18, 11, 15, 12, 13, 12, 16,
-    13, 17, 14, 15, 14, 17, 16, 17, 16, 18,
-};
-
-static const int edges_G_p[] = {
-    0, 1, 0, 4, 0, 10, 1, 5, 1, 11, 2, 3, 2, 4, 2, 12,
-    3, 5, 3, 13, 4, 5, 6, 7, 6, 8, 6, 14, 7, 9, 7, 15,
-    8, 9, 8, 16, 9, 18, 10, 11, 10, 18, 11, 15, 12, 13, 12, 16,
-    13, 17, 14, 15, 14, 17, 16, 17, 16, 18,
-};
-
-static const int edges_H[] = {
-    0, 1, 0, 3, 0, 5, 1, 4, 1, 6, 2, 3, 2, 11, 2, 13,
-    3, 4, 4, 13, 5, 6, 5, 7, 6, 8, 7, 8, 7, 16, 7, 18,
-    8, 10, 9, 10, 9, 12, 9, 14, 10, 17, 11, 12, 11, 16, 12, 13,
-    14, 15, 14, 17, 15, 16, 15, 18, 17, 18,
-};
-
-static const int edges_H_p[] = {
-    0, 1, 0, 3, 0, 5, 1, 4, 1, 6, 2, 3, 2, 11, 2, 13,
-    3, 4, 4, 13, 5, 6, 5, 7, 6, 8, 7, 8, 7, 16, 7, 18,
-    8, 10, 9, 10, 9, 12, 9, 14, 10, 17, 11, 12, 11, 16, 12, 13,
-    14, 15, 14, 17, 15, 16, 15, 18, 17, 18,
-};
-
-static const int edges_I[] = {
-    0, 1, 0, 2, 0, 4, 1, 3, 1, 5, 2, 3, 2, 6, 3, 7,
-    4, 5, 4, 6, 5, 7, 6, 7,
-};
-
-static const int edges_J[] = {
-    0, 2, 0, 4, 0, 13, 2, 5, 2, 16, 4, 5, 4, 17, 5, 18,
-    6, 8, 6, 9, 6, 11, 8, 10, 8, 12, 9, 10, 9, 13, 10, 15,
-    11, 12, 11, 16, 12, 18, 13, 15, 13, 16, 15, 17, 17, 18,
-};
-
-static const int edges_J_p[] = {
-    0, 2, 0, 4, 0, 13, 2, 5, 2, 16, 4, 5, 4, 17, 5, 18,
-    6, 8, 6, 9, 6, 11, 8, 10, 8, 12, 9, 10, 9, 13, 10, 15,
-    11, 12, 11, 16, 12, 18, 13, 15, 13, 16, 15, 17, 17, 18,
-};
-
-static const int edges_K[] = {
-    0, 4, 0, 11, 1, 5, 1, 12, 2, 3, 2, 4, 2, 6, 3, 5,
-    3, 7, 4, 5, 6, 19, 7, 10, 8, 9, 8, 20, 9, 10, 9, 13,
-    11, 12, 11, 14, 11, 19, 11, 21, 11, 23, 12, 15, 13, 17, 14, 15,
-    14, 16, 15, 17, 16, 17, 16, 23, 18, 19, 18, 20, 18, 21, 20, 22,
-    21, 22, 22, 23,
-};
-
-static const int edges_L[] = {
-    0, 1, 0, 2, 0, 8, 1, 3, 1, 9, 2, 3, 2, 4, 3, 5,
-    4, 5, 4, 6, 5, 7, 6, 7, 6, 10, 7, 11, 8, 9, 8, 10,
-    9, 11, 10, 11,
-};
-
-static const int edges_M[] = {
-    0, 3, 0, 11, 1, 5, 1, 14, 1, 21, 2, 3, 2, 4, 2, 6,
-    3, 5, 4, 5, 4, 21, 6, 17, 6, 21, 7, 8, 7, 9, 7, 19,
-    8, 10, 8, 11, 9, 10, 9, 23, 10, 12, 12, 16, 12, 23, 13, 14,
-    13, 15, 13, 21, 14, 16, 15, 16, 15, 23, 17, 18, 17, 20, 18, 19,
-    18, 22, 19, 23, 20, 21, 20, 22, 21, 23, 22, 23,
-};
-
-static const int edges_N[] = {
-    0, 1, 0, 3, 0, 15, 1, 2, 1, 4, 2, 14, 2, 15, 3, 4,
-    3, 7, 4, 8, 5, 6, 5, 7, 5, 11, 6, 8, 6, 12, 7, 8,
-    9, 10, 9, 11, 9, 13, 10, 12, 10, 14, 11, 12, 13, 14, 13, 15,
-};
-
-static const int edges_P[] = {
-    0, 1, 0, 7, 0, 10, 1, 8, 1, 11, 2, 3, 2, 4, 2, 7,
-    3, 5, 3, 8, 4, 5, 4, 6, 5, 9, 6, 9, 6, 10, 7, 8,
-    9, 11, 10, 11,
-};
-
-static const int edges_Q[] = {
-    0, 1, 0, 8, 0, 10, 1, 9, 1, 11, 2, 3, 2, 9, 2, 12,
-    3, 4, 3, 5, 4, 7, 4, 12, 5, 7, 5, 13, 6, 7, 6, 11,
-    6, 12, 8, 9, 8, 13, 10, 11, 10, 13,
-};
-
-static const int edges_R[] = {
-    0, 1, 0, 2, 0, 9, 1, 3, 1, 6, 2, 3, 2, 4, 3, 5,
-    4, 9, 4, 18, 5, 14, 5, 19, 6, 8, 6, 9, 7, 8, 7, 9,
-    7, 10, 8, 11, 9, 15, 9, 17, 10, 11, 10, 12, 11, 13, 12, 13,
-    12, 17, 13, 14, 14, 17, 15, 16, 15, 18, 16, 17, 16, 19, 18, 19,
-};
-
-static const int edges_R_p[] = {
-    0, 1, 0, 2, 0, 9, 1, 3, 1, 6, 2, 3, 2, 4, 3, 5,
-    4, 9, 4, 18, 5, 14, 5, 19, 6, 8, 6, 9, 7, 8, 7, 9,
-    7, 10, 8, 11, 9, 15, 9, 17, 10, 11, 10, 12, 11, 13, 12, 13,
-    12, 17, 13, 14, 14, 17, 15, 16, 15, 18, 16, 17, 16, 19, 18, 19,
-};
-
-static const int edges_S[] = {
-    0, 1, 0, 8, 0, 11, 1, 4, 1, 14, 2, 4, 2, 5, 2, 15,
-    3, 7, 3, 11, 3, 13, 4, 6, 5, 6, 5, 7, 6, 12, 7, 12,
-    8, 9, 8, 14, 9, 10, 9, 13, 10, 14, 10, 15, 11, 12, 13, 15,
-};
-
-static const int edges_S_p[] = {
-    0, 1, 0, 8, 0, 11, 1, 4, 1, 14, 2, 4, 2, 5, 2, 15,
-    3, 7, 3, 11, 3, 13, 4, 6, 5, 6, 5, 7, 6, 12, 7, 12,
-    8, 9, 8, 14, 9, 10, 9, 13, 10, 14, 10, 15, 11, 12, 13, 15,
-};
-
-static const int edges_T[] = {
-    0, 1, 0, 2, 0, 4, 1, 3, 1, 5, 2, 3, 2, 6, 3, 7,
-    4, 10, 5, 11, 6, 18, 7, 19, 8, 9, 8, 10, 8, 12, 9, 11,
-    9, 13, 10, 11, 12, 13, 12, 14, 13, 15, 14, 16, 15, 17, 16, 20,
-    17, 21, 18, 19, 18, 22, 19, 23, 20, 21, 20, 22, 21, 23, 22, 23,
-};
-
-static const int edges_U[] = {
-    0, 1, 0, 2, 0, 14, 1, 3, 1, 15, 2, 3, 2, 12, 3, 13,
-    4, 5, 4, 6, 4, 12, 5, 7, 5, 13, 6, 7, 6, 8, 7, 9,
-    8, 9, 8, 10, 9, 11, 10, 11, 10, 14, 11, 15, 12, 13, 14, 15,
-};
-
-static const int edges_V[] = {
-    0, 1, 0, 2, 0, 14, 1, 3, 1, 15, 2, 3, 2, 10, 3, 11,
-    4, 5, 4, 6, 4, 10, 5, 7, 5, 11, 6, 7, 6, 14, 7, 15,
-    10, 11, 14, 15,
-};
-
-static const int edges_W[] = {
-    0, 1, 0, 2, 0, 16, 1, 3, 1, 17, 2, 3, 2, 6, 3, 7,
-    4, 5, 4, 6, 4, 15, 5, 7, 5, 8, 6, 7, 8, 14, 8, 15,
-    9, 10, 9, 11, 9, 18, 10, 12, 10, 19, 11, 12, 11, 13, 12, 14,
-    13, 14, 13, 15, 16, 17, 16, 18, 17, 19, 18, 19,
-};
-
-static const int edges_X[] = {
-    0, 1, 0, 2, 0, 22, 1, 3, 1, 23, 2, 3, 2, 20, 3, 21,
-    4, 5, 4, 6, 4, 13, 5, 7, 5, 14, 6, 7, 6, 8, 7, 9,
-    8, 9, 8, 22, 9, 23, 10, 11, 10, 13, 10, 19, 11, 12, 11, 14,
-    12, 16, 12, 19, 13, 14, 15, 16, 15, 17, 15, 19, 16, 18, 17, 18,
-    17, 20, 18, 21, 20, 21, 22, 23,
-};
-
-static const int edges_Y[] = {
-    0, 1, 0, 2, 0, 15, 1, 3, 1, 14, 2, 3, 2, 11, 3, 12,
-    4, 5, 4, 6, 4, 10, 5, 7, 5, 13, 6, 7, 6, 15, 7, 14,
-    8, 9, 8, 10, 8, 11, 9, 12, 9, 13, 10, 13, 11, 12, 14, 15,
-};
-
-static const int edges_Z[] = {
-    0, 1, 0, 2, 0, 3, 1, 4, 1, 5, 2, 5, 2, 8, 3, 4,
-    3, 6, 4, 7, 5, 9, 6, 7, 6, 12, 7, 13, 8, 9, 8, 10,
-    9, 11, 10, 11, 10, 14, 11, 15, 12, 13, 12, 14, 13, 15, 14, 15,
-};
-
-static const int face_vertices_A[] = {
-    0, 14, 10, 1,
-    4, 5, 3, 2,
-    1, 4, 2, 0,
-    8, 9, 7, 6,
-    5, 8, 6, 3,
-    13, 12, 15, 16,
-    9, 11, 17, 7,
-    13, 10, 14, 12,
-    11, 19, 18, 17,
-    19, 16, 15, 18,
-    2, 3, 6, 7, 17, 18, 15, 12, 14, 0,
-    4, 1, 10, 13, 16, 19, 11, 9, 8, 5,
-};
-
-static const int face_vertices_B[] = {
-    3, 8, 1, 0,
-    2, 4, 3, 0,
-    2, 5, 6, 4,
-    4, 6, 7, 8, 3,
-    1, 8, 11, 9, 13, 15,
-    6, 5, 17, 16, 14, 10, 12, 7,
-    8, 7, 12, 11,
-    11, 12, 10, 9,
-    13, 14, 16, 15,
-    15, 16, 17, 1,
-    0, 1, 17, 5, 2,
-    10, 14, 13, 9,
-};
-
-static const int face_vertices_E[] = {
-    0, 1, 11, 10,
-    4, 5, 3, 2,
-    2, 3, 1, 0,
-    9, 18, 10, 8,
-    7, 9, 8, 6,
-    14, 15, 13, 12,
-    12, 13, 5, 4,
-    6, 16, 17, 7,
-    11, 1, 3, 5, 13, 15, 17, 16,
-    4, 2, 0, 10, 18, 14, 12,
-    7, 17, 15, 14, 18, 9,
-};
-
-static const int face_vertices_E_p[] = {
-    0, 10, 11, 1,
-    4, 2, 3, 5,
-    2, 0, 1, 3,
-    9, 8, 10, 18,
-    7, 6, 8, 9,
-    14, 12, 13, 15,
-    12, 4, 5, 13,
-    6, 7, 17, 16,
-    11, 16, 17, 15, 13, 5, 3, 1,
-    4, 12, 14, 18, 10, 0, 2,
-    7, 9, 18, 14, 15, 17,
-};
-
-static const int face_vertices_F[] = {
-    2, 3, 1, 0,
-    0, 1, 15, 14,
-    4, 5, 7, 6,
-    6, 7, 19, 8,
-    5, 4, 16, 17,
-    3, 19, 7, 5, 17, 11, 10, 13, 15, 1,
-    9, 10, 11, 18,
-    14, 15, 13, 12,
-    12, 13, 10, 9,
-    18, 11, 17, 16,
-    3, 2, 8, 19,
-    8, 2, 0, 14, 12, 9, 18, 16, 4, 6,
-};
-
-static const int face_vertices_G[] = {
-    0, 1, 5, 4,
-    4, 5, 3, 2,
-    9, 18, 16, 8,
-    7, 9, 8, 6,
-    10, 11, 1, 0,
-    5, 1, 11, 15, 14, 17, 13, 3,
-    12, 13, 17, 16,
-    8, 16, 17, 14, 6,
-    0, 4, 2, 12, 16, 18, 10,
-    2, 3, 13, 12,
-    6, 14, 15, 7,
-    7, 15, 11, 10, 18, 9,
-};
-
-static const int face_vertices_G_p[] = {
-    0, 4, 5, 1,
-    4, 2, 3, 5,
-    9, 8, 16, 18,
-    7, 6, 8, 9,
-    10, 0, 1, 11,
-    5, 3, 13, 17, 14, 15, 11, 1,
-    12, 16, 17, 13,
-    8, 6, 14, 17, 16,
-    0, 10, 18, 16, 12, 2, 4,
-    2, 12, 13, 3,
-    6, 7, 15, 14,
-    7, 9, 18, 10, 11, 15,
-};
-
-static const int face_vertices_H[] = {
-    13, 4, 3, 2,
-    10, 8, 7, 18, 17,
-    4, 1, 0, 3,
-    5, 0, 1, 6,
-    6, 8, 7, 5,
-    1, 4, 13, 12, 9, 10, 8, 6,
-    2, 3, 0, 5, 7, 16, 11,
-    13, 12, 11, 2,
-    9, 10, 17, 14,
-    17, 18, 15, 14,
-    16, 11, 12, 9, 14, 15,
-    7, 16, 15, 18,
-};
-
-static const int face_vertices_H_p[] = {
-    13, 2, 3, 4,
-    10, 17, 18, 7, 8,
-    4, 3, 0, 1,
-    5, 6, 1, 0,
-    6, 5, 7, 8,
-    1, 6, 8, 10, 9, 12, 13, 4,
-    2, 11, 16, 7, 5, 0, 3,
-    13, 2, 11, 12,
-    9, 14, 17, 10,
-    17, 14, 15, 18,
-    16, 15, 14, 9, 12, 11,
-    7, 18, 15, 16,
-};
-
-static const int face_vertices_I[] = {
-    2, 3, 1, 0,
-    2, 0, 4, 6,
-    4, 5, 7, 6,
-    3, 2, 6, 7,
-    1, 5, 4, 0,
-    3, 7, 5, 1,
-};
-
-static const int face_vertices_J[] = {
-    2, 0, 4, 5,
-    8, 6, 9, 10,
-    4, 17, 18, 5,
-    5, 18, 12, 11, 16, 2,
-    15, 10, 9, 13,
-    2, 16, 13, 0,
-    0, 13, 15, 17, 4,
-    10, 15, 17, 18, 12, 8,
-    8, 12, 11, 6,
-    16, 11, 6, 9, 13,
-};
-
-static const int face_vertices_J_p[] = {
-    2, 5, 4, 0,
-    8, 10, 9, 6,
-    4, 5, 18, 17,
-    5, 2, 16, 11, 12, 18,
-    15, 13, 9, 10,
-    2, 0, 13, 16,
-    0, 4, 17, 15, 13,
-    10, 8, 12, 18, 17, 15,
-    8, 6, 11, 12,
-    16, 13, 9, 6, 11,
-};
-
-static const int face_vertices_K[] = {
-    0, 4, 2, 6, 19, 11,
-    4, 5, 3, 2,
-    1, 5, 4, 0, 11, 12,
-    16, 17, 15, 14,
-    14, 15, 12, 11,
-    23, 16, 14, 11,
-    8, 9, 13, 17, 16, 23, 22, 20,
-    5, 1, 12, 15, 17, 13, 9, 10, 7, 3,
-    22, 23, 11, 21,
-    21, 11, 19, 18,
-    20, 22, 21, 18,
-    2, 3, 7, 10, 9, 8, 20, 18, 19, 6,
-};
-
-static const int face_vertices_L[] = {
-    0, 1, 3, 2,
-    2, 3, 5, 4,
-    9, 1, 0, 8,
-    8, 0, 2, 4, 6, 10,
-    6, 7, 11, 10,
-    10, 11, 9, 8,
-    7, 6, 4, 5,
-    1, 9, 11, 7, 5, 3,
-};
-
-static const int face_vertices_M[] = {
-    21, 1, 5, 4,
-    4, 5, 3, 2,
-    21, 4, 2, 6,
-    7, 8, 10, 9,
-    9, 10, 12, 23,
-    9, 23, 19, 7,
-    23, 12, 16, 15,
-    15, 16, 14, 13,
-    13, 14, 1, 21,
-    23, 15, 13, 21,
-    5, 1, 14, 16, 12, 10, 8, 11, 0, 3,
-    18, 19, 23, 22,
-    22, 23, 21, 20,
-    20, 21, 6, 17,
-    18, 22, 20, 17,
-    2, 3, 0, 11, 8, 7, 19, 18, 17, 6,
-};
-
-static const int face_vertices_N[] = {
-    0, 1, 2, 15,
-    3, 4, 1, 0,
-    5, 6, 8, 7,
-    6, 5, 11, 12,
-    9, 10, 12, 11,
-    3, 0, 15, 13, 9, 11, 5, 7,
-    15, 2, 14, 13,
-    4, 3, 7, 8,
-    14, 10, 9, 13,
-    2, 1, 4, 8, 6, 12, 10, 14,
-};
-
-static const int face_vertices_P[] = {
-    6, 9, 5, 4,
-    4, 5, 3, 2,
-    2, 3, 8, 7,
-    7, 0, 10, 6, 4, 2,
-    8, 1, 0, 7,
-    10, 11, 9, 6,
-    1, 8, 3, 5, 9, 11,
-    0, 1, 11, 10,
-};
-
-static const int face_vertices_Q[] = {
-    2, 3, 4, 12,
-    12, 4, 7, 6,
-    7, 4, 3, 5,
-    5, 3, 2, 9, 8, 13,
-    6, 7, 5, 13, 10, 11,
-    1, 0, 8, 9,
-    0, 1, 11, 10,
-    0, 10, 13, 8,
-    1, 9, 2, 12, 6, 11,
-};
-
-static const int face_vertices_R[] = {
-    0, 9, 6, 1,
-    2, 0, 1, 3,
-    9, 0, 2, 4,
-    9, 7, 8, 6,
-    10, 12, 13, 11,
-    12, 17, 14, 13,
-    17, 12, 10, 7, 9,
-    17, 16, 19, 5, 14,
-    15, 16, 17, 9,
-    7, 10, 11, 8,
-    6, 8, 11, 13, 14, 5, 3, 1,
-    18, 15, 9, 4,
-    16, 15, 18, 19,
-    3, 5, 19, 18, 4, 2,
-};
-
-static const int face_vertices_R_p[] = {
-    0, 1, 6, 9,
-    2, 3, 1, 0,
-    9, 4, 2, 0,
-    9, 6, 8, 7,
-    10, 11, 13, 12,
-    12, 13, 14, 17,
-    17, 9, 7, 10, 12,
-    17, 14, 5, 19, 16,
-    15, 9, 17, 16,
-    7, 8, 11, 10,
-    6, 1, 3, 5, 14, 13, 11, 8,
-    18, 4, 9, 15,
-    16, 19, 18, 15,
-    3, 2, 4, 18, 19, 5,
-};
-
-static const int face_vertices_S[] = {
-    9, 10, 15, 13,
-    7, 3, 13, 15, 2, 5,
-    7, 5, 6, 12,
-    5, 2, 4, 6,
-    0, 8, 9, 13, 3, 11,
-    1, 4, 2, 15, 10, 14,
-    3, 7, 12, 11,
-    1, 14, 8, 0,
-    9, 8, 14, 10,
-    1, 0, 11, 12, 6, 4,
-};
-
-static const int face_vertices_S_p[] = {
-    9, 13, 15, 10,
-    7, 5, 2, 15, 13, 3,
-    7, 12, 6, 5,
-    5, 6, 4, 2,
-    0, 11, 3, 13, 9, 8,
-    1, 14, 10, 15, 2, 4,
-    3, 11, 12, 7,
-    1, 0, 8, 14,
-    9, 10, 14, 8,
-    1, 4, 6, 12, 11, 0,
-};
-
-static const int face_vertices_T[] = {
-    0, 1, 3, 2,
-    15, 13, 12, 14, 16, 20, 21, 17,
-    2, 6, 18, 22, 20, 16, 14, 12, 8, 10, 4, 0,
-    8, 9, 11, 10,
-    12, 13, 9, 8,
-    18, 19, 23, 22,
-    22, 23, 21, 20,
-    5, 1, 0, 4, 10, 11,
-    2, 3, 7, 19, 18, 6,
-    7, 3, 1, 5, 11, 9, 13, 15, 17, 21, 23, 19,
-};
-
-static const int face_vertices_U[] = {
-    0, 1, 3, 2,
-    14, 15, 1, 0,
-    6, 7, 9, 8,
-    8, 9, 11, 10,
-    13, 5, 4, 12,
-    2, 12, 4, 6, 8, 10, 14, 0,
-    10, 11, 15, 14,
-    2, 3, 13, 12,
-    4, 5, 7, 6,
-    3, 1, 15, 11, 9, 7, 5, 13,
-};
-
-static const int face_vertices_V[] = {
-    2, 3, 1, 0,
-    6, 7, 5, 4,
-    0, 14, 6, 4, 10, 2,
-    1, 15, 14, 0,
-    7, 6, 14, 15,
-    5, 11, 10, 4,
-    3, 2, 10, 11,
-    1, 3, 11, 5, 7, 15,
-};
-
-static const int face_vertices_W[] = {
-    6, 7, 3, 2,
-    2, 3, 1, 0,
-    15, 8, 5, 4,
-    4, 5, 7, 6,
-    18, 19, 10, 9,
-    11, 12, 14, 13,
-    13, 14, 8, 15,
-    0, 1, 17, 16,
-    16, 17, 19, 18,
-    6, 2, 0, 16, 18, 9, 11, 13, 15, 4,
-    9, 10, 12, 11,
-    3, 7, 5, 8, 14, 12, 10, 19, 17, 1,
-};
-
-static const int face_vertices_X[] = {
-    20, 21, 3, 2,
-    2, 3, 1, 0,
-    0, 1, 23, 22,
-    22, 23, 9, 8,
-    8, 9, 7, 6,
-    6, 7, 5, 4,
-    10, 11, 12, 19,
-    4, 5, 14, 13,
-    13, 14, 11, 10,
-    0, 22, 8, 6, 4, 13, 10, 19, 15, 17, 20, 2,
-    15, 16, 18, 17,
-    17, 18, 21, 20,
-    19, 12, 16, 15,
-    3, 21, 18, 16, 12, 11, 14, 5, 7, 9, 23, 1,
-};
-
-static const int face_vertices_Y[] = {
-    0, 1, 3, 2,
-    4, 5, 7, 6,
-    6, 7, 14, 15,
-    10, 13, 5, 4,
-    8, 9, 13, 10,
-    11, 12, 9, 8,
-    1, 14, 7, 5, 13, 9, 12, 3,
-    1, 0, 15, 14,
-    2, 3, 12, 11,
-    0, 2, 11, 8, 10, 4, 6, 15,
-};
-
-static const int face_vertices_Z[] = {
-    0, 1, 5, 2,
-    3, 4, 1, 0,
-    8, 9, 11, 10,
-    6, 3, 0, 2, 8, 10, 14, 12,
-    2, 5, 9, 8,
-    10, 11, 15, 14,
-    14, 15, 13, 12,
-    7, 4, 3, 6,
-    7, 6, 12, 13,
-    5, 1, 4, 7, 13, 15, 11, 9,
-};
-
-static const int face_vertex_counts_A[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    10,
-    10,
-};
-
-static const int face_vertex_counts_B[] = {
-    4,
-    4,
-    4,
-    5,
-    6,
-    8,
-    4,
-    4,
-    4,
-    4,
-    5,
-    4,
-};
-
-static const int face_vertex_counts_E[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    8,
-    7,
-    6,
-};
-
-static const int face_vertex_counts_E_p[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    8,
-    7,
-    6,
-};
-
-static const int face_vertex_counts_F[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    10,
-    4,
-    4,
-    4,
-    4,
-    4,
-    10,
-};
-
-static const int face_vertex_counts_G[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    8,
-    4,
-    5,
-    7,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_G_p[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    8,
-    4,
-    5,
-    7,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_H[] = {
-    4,
-    5,
-    4,
-    4,
-    4,
-    8,
-    7,
-    4,
-    4,
-    4,
-    6,
-    4,
-};
-
-static const int face_vertex_counts_H_p[] = {
-    4,
-    5,
-    4,
-    4,
-    4,
-    8,
-    7,
-    4,
-    4,
-    4,
-    6,
-    4,
-};
-
-static const int face_vertex_counts_I[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-};
-
-static const int face_vertex_counts_J[] = {
-    4,
-    4,
-    4,
-    6,
-    4,
-    4,
-    5,
-    6,
-    4,
-    5,
-};
-
-static const int face_vertex_counts_J_p[] = {
-    4,
-    4,
-    4,
-    6,
-    4,
-    4,
-    5,
-    6,
-    4,
-    5,
-};
-
-static const int face_vertex_counts_K[] = {
-    6,
-    4,
-    6,
-    4,
-    4,
-    4,
-    8,
-    10,
-    4,
-    4,
-    4,
-    10,
-};
-
-static const int face_vertex_counts_L[] = {
-    4,
-    4,
-    4,
-    6,
-    4,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_M[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    10,
-    4,
-    4,
-    4,
-    4,
-    10,
-};
-
-static const int face_vertex_counts_N[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    8,
-    4,
-    4,
-    4,
-    8,
-};
-
-static const int face_vertex_counts_P[] = {
-    4,
-    4,
-    4,
-    6,
-    4,
-    4,
-    6,
-    4,
-};
-
-static const int face_vertex_counts_Q[] = {
-    4,
-    4,
-    4,
-    6,
-    6,
-    4,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_R[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    5,
-    5,
-    4,
-    4,
-    8,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_R_p[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    5,
-    5,
-    4,
-    4,
-    8,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_S[] = {
-    4,
-    6,
-    4,
-    4,
-    6,
-    6,
-    4,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_S_p[] = {
-    4,
-    6,
-    4,
-    4,
-    6,
-    6,
-    4,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_T[] = {
-    4,
-    8,
-    12,
-    4,
-    4,
-    4,
-    4,
-    6,
-    6,
-    12,
-};
-
-static const int face_vertex_counts_U[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    8,
-    4,
-    4,
-    4,
-    8,
-};
-
-static const int face_vertex_counts_V[] = {
-    4,
-    4,
-    6,
-    4,
-    4,
-    4,
-    4,
-    6,
-};
-
-static const int face_vertex_counts_W[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    10,
-    4,
-    10,
-};
-
-static const int face_vertex_counts_X[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    12,
-    4,
-    4,
-    4,
-    12,
-};
-
-static const int face_vertex_counts_Y[] = {
-    4,
-    4,
-    4,
-    4,
-    4,
-    4,
-    8,
-    4,
-    4,
-    8,
-};
-
-static const int face_vertex_counts_Z[] = {
-    4,
-    4,
-    4,
-    8,
-    4,
-    4,
-    4,
-    4,
-    4,
-    8,
+static const uint8_t pentacube_blob[4971] = {
+    // A: vertices @ 0
+    0x01, 0x00, 0x01, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x01, 0x01, 0x02, 0x00, 0x00, 0x02,
+    0x01, 0x00, 0x03, 0x01, 0x01, 0x03, 0x02, 0x01, 0x03, 0x01, 0x00, 0x03, 0x02, 0x00, 0x01, 0x01,
+    0x00, 0x01, 0x02, 0x00, 0x00, 0x01, 0x01, 0x00, 0x01, 0x00, 0x01, 0x01, 0x01, 0x00, 0x03, 0x01,
+    0x00, 0x03, 0x00, 0x01, 0x02, 0x01, 0x01, 0x03, 0x01, 0x01, 0x03, 0x00,
+    // A: edges @ 60
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x0e, 0x01, 0x04, 0x01, 0x0a, 0x02, 0x03, 0x02, 0x04, 0x03, 0x05,
+    0x03, 0x06, 0x04, 0x05, 0x05, 0x08, 0x06, 0x07, 0x06, 0x08, 0x07, 0x09, 0x07, 0x11, 0x08, 0x09,
+    0x09, 0x0b, 0x0a, 0x0d, 0x0a, 0x0e, 0x0b, 0x11, 0x0b, 0x13, 0x0c, 0x0d, 0x0c, 0x0e, 0x0c, 0x0f,
+    0x0d, 0x10, 0x0f, 0x10, 0x0f, 0x12, 0x10, 0x13, 0x11, 0x12, 0x12, 0x13,
+    // A: face vertices @ 120
+    0x00, 0x0e, 0x0a, 0x01, 0x04, 0x05, 0x03, 0x02, 0x01, 0x04, 0x02, 0x00, 0x08, 0x09, 0x07, 0x06,
+    0x05, 0x08, 0x06, 0x03, 0x0d, 0x0c, 0x0f, 0x10, 0x09, 0x0b, 0x11, 0x07, 0x0d, 0x0a, 0x0e, 0x0c,
+    0x0b, 0x13, 0x12, 0x11, 0x13, 0x10, 0x0f, 0x12, 0x02, 0x03, 0x06, 0x07, 0x11, 0x12, 0x0f, 0x0c,
+    0x0e, 0x00, 0x04, 0x01, 0x0a, 0x0d, 0x10, 0x13, 0x0b, 0x09, 0x08, 0x05,
+    // A: face vertex counts @ 180
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0a, 0x0a,
+    // B: vertices @ 192
+    0x01, 0x00, 0x01, 0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x00, 0x00, 0x01,
+    0x02, 0x00, 0x02, 0x02, 0x00, 0x02, 0x02, 0x01, 0x02, 0x01, 0x01, 0x03, 0x01, 0x02, 0x03, 0x02,
+    0x02, 0x03, 0x01, 0x01, 0x03, 0x02, 0x01, 0x00, 0x01, 0x02, 0x00, 0x02, 0x02, 0x00, 0x01, 0x01,
+    0x00, 0x02, 0x01, 0x01, 0x02, 0x01,
+    // B: edges @ 246
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x03, 0x01, 0x08, 0x01, 0x0f, 0x01, 0x11, 0x02, 0x04, 0x02, 0x05,
+    0x03, 0x04, 0x03, 0x08, 0x04, 0x06, 0x05, 0x06, 0x05, 0x11, 0x06, 0x07, 0x07, 0x08, 0x07, 0x0c,
+    0x08, 0x0b, 0x09, 0x0a, 0x09, 0x0b, 0x09, 0x0d, 0x0a, 0x0c, 0x0a, 0x0e, 0x0b, 0x0c, 0x0d, 0x0e,
+    0x0d, 0x0f, 0x0e, 0x10, 0x0f, 0x10, 0x10, 0x11,
+    // B: face vertices @ 302
+    0x03, 0x08, 0x01, 0x00, 0x02, 0x04, 0x03, 0x00, 0x02, 0x05, 0x06, 0x04, 0x04, 0x06, 0x07, 0x08,
+    0x03, 0x01, 0x08, 0x0b, 0x09, 0x0d, 0x0f, 0x06, 0x05, 0x11, 0x10, 0x0e, 0x0a, 0x0c, 0x07, 0x08,
+    0x07, 0x0c, 0x0b, 0x0b, 0x0c, 0x0a, 0x09, 0x0d, 0x0e, 0x10, 0x0f, 0x0f, 0x10, 0x11, 0x01, 0x00,
+    0x01, 0x11, 0x05, 0x02, 0x0a, 0x0e, 0x0d, 0x09,
+    // B: face vertex counts @ 358
+    0x04, 0x04, 0x04, 0x05, 0x06, 0x08, 0x04, 0x04, 0x04, 0x04, 0x05, 0x04,
+    // E: vertices @ 370
+    0x01, 0x00, 0x01, 0x01, 0x00, 0x02, 0x02, 0x00, 0x01, 0x02, 0x00, 0x02, 0x02, 0x01, 0x01, 0x02,
+    0x01, 0x02, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x01, 0x00, 0x01, 0x02, 0x00, 0x01, 0x01,
+    0x01, 0x01, 0x01, 0x02, 0x03, 0x01, 0x01, 0x03, 0x01, 0x02, 0x03, 0x02, 0x01, 0x03, 0x02, 0x02,
+    0x00, 0x01, 0x02, 0x00, 0x02, 0x02, 0x01, 0x02, 0x01,
+    // E: edges @ 427
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x0a, 0x01, 0x03, 0x01, 0x0b, 0x02, 0x03, 0x02, 0x04, 0x03, 0x05,
+    0x04, 0x05, 0x04, 0x0c, 0x05, 0x0d, 0x06, 0x07, 0x06, 0x08, 0x06, 0x10, 0x07, 0x09, 0x07, 0x11,
+    0x08, 0x09, 0x08, 0x0a, 0x09, 0x12, 0x0a, 0x0b, 0x0a, 0x12, 0x0b, 0x10, 0x0c, 0x0d, 0x0c, 0x0e,
+    0x0d, 0x0f, 0x0e, 0x0f, 0x0e, 0x12, 0x0f, 0x11, 0x10, 0x11,
+    // E: face vertices @ 485
+    0x00, 0x01, 0x0b, 0x0a, 0x04, 0x05, 0x03, 0x02, 0x02, 0x03, 0x01, 0x00, 0x09, 0x12, 0x0a, 0x08,
+    0x07, 0x09, 0x08, 0x06, 0x0e, 0x0f, 0x0d, 0x0c, 0x0c, 0x0d, 0x05, 0x04, 0x06, 0x10, 0x11, 0x07,
+    0x0b, 0x01, 0x03, 0x05, 0x0d, 0x0f, 0x11, 0x10, 0x04, 0x02, 0x00, 0x0a, 0x12, 0x0e, 0x0c, 0x07,
+    0x11, 0x0f, 0x0e, 0x12, 0x09,
+    // E: face vertex counts @ 538
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x08, 0x07, 0x06,
+    // E': vertices @ 549
+    0x02, 0x00, 0x01, 0x02, 0x00, 0x02, 0x01, 0x00, 0x01, 0x01, 0x00, 0x02, 0x01, 0x01, 0x01, 0x01,
+    0x01, 0x02, 0x03, 0x01, 0x00, 0x03, 0x02, 0x00, 0x02, 0x01, 0x00, 0x02, 0x02, 0x00, 0x02, 0x01,
+    0x01, 0x02, 0x01, 0x02, 0x00, 0x01, 0x01, 0x00, 0x01, 0x02, 0x00, 0x02, 0x01, 0x00, 0x02, 0x02,
+    0x03, 0x01, 0x02, 0x03, 0x02, 0x02, 0x02, 0x02, 0x01,
+    // E': edges @ 606
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x0a, 0x01, 0x03, 0x01, 0x0b, 0x02, 0x03, 0x02, 0x04, 0x03, 0x05,
+    0x04, 0x05, 0x04, 0x0c, 0x05, 0x0d, 0x06, 0x07, 0x06, 0x08, 0x06, 0x10, 0x07, 0x09, 0x07, 0x11,
+    0x08, 0x09, 0x08, 0x0a, 0x09, 0x12, 0x0a, 0x0b, 0x0a, 0x12, 0x0b, 0x10, 0x0c, 0x0d, 0x0c, 0x0e,
+    0x0d, 0x0f, 0x0e, 0x0f, 0x0e, 0x12, 0x0f, 0x11, 0x10, 0x11,
+    // E': face vertices @ 664
+    0x00, 0x0a, 0x0b, 0x01, 0x04, 0x02, 0x03, 0x05, 0x02, 0x00, 0x01, 0x03, 0x09, 0x08, 0x0a, 0x12,
+    0x07, 0x06, 0x08, 0x09, 0x0e, 0x0c, 0x0d, 0x0f, 0x0c, 0x04, 0x05, 0x0d, 0x06, 0x07, 0x11, 0x10,
+    0x0b, 0x10, 0x11, 0x0f, 0x0d, 0x05, 0x03, 0x01, 0x04, 0x0c, 0x0e, 0x12, 0x0a, 0x00, 0x02, 0x07,
+    0x09, 0x12, 0x0e, 0x0f, 0x11,
+    // E': face vertex counts @ 717
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x08, 0x07, 0x06,
+    // F: vertices @ 728
+    0x03, 0x01, 0x00, 0x03, 0x01, 0x01, 0x03, 0x02, 0x00, 0x03, 0x02, 0x01, 0x00, 0x03, 0x00, 0x00,
+    0x03, 0x01, 0x01, 0x03, 0x00, 0x01, 0x03, 0x01, 0x01, 0x02, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00,
+    0x01, 0x01, 0x01, 0x01, 0x02, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x01, 0x00, 0x02, 0x01, 0x01,
+    0x00, 0x01, 0x00, 0x00, 0x01, 0x01, 0x01, 0x01, 0x00, 0x01, 0x02, 0x01,
+    // F: edges @ 788
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x0e, 0x01, 0x03, 0x01, 0x0f, 0x02, 0x03, 0x02, 0x08, 0x03, 0x13,
+    0x04, 0x05, 0x04, 0x06, 0x04, 0x10, 0x05, 0x07, 0x05, 0x11, 0x06, 0x07, 0x06, 0x08, 0x07, 0x13,
+    0x08, 0x13, 0x09, 0x0a, 0x09, 0x0c, 0x09, 0x12, 0x0a, 0x0b, 0x0a, 0x0d, 0x0b, 0x11, 0x0b, 0x12,
+    0x0c, 0x0d, 0x0c, 0x0e, 0x0d, 0x0f, 0x0e, 0x0f, 0x10, 0x11, 0x10, 0x12,
+    // F: face vertices @ 848
+    0x02, 0x03, 0x01, 0x00, 0x00, 0x01, 0x0f, 0x0e, 0x04, 0x05, 0x07, 0x06, 0x06, 0x07, 0x13, 0x08,
+    0x05, 0x04, 0x10, 0x11, 0x03, 0x13, 0x07, 0x05, 0x11, 0x0b, 0x0a, 0x0d, 0x0f, 0x01, 0x09, 0x0a,
+    0x0b, 0x12, 0x0e, 0x0f, 0x0d, 0x0c, 0x0c, 0x0d, 0x0a, 0x09, 0x12, 0x0b, 0x11, 0x10, 0x03, 0x02,
+    0x08, 0x13, 0x08, 0x02, 0x00, 0x0e, 0x0c, 0x09, 0x12, 0x10, 0x04, 0x06,
+    // F: face vertex counts @ 908
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x0a, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0a,
+    // G: vertices @ 920
+    0x01, 0x01, 0x01, 0x01, 0x01, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x01, 0x00,
+    0x01, 0x02, 0x03, 0x01, 0x00, 0x03, 0x02, 0x00, 0x02, 0x01, 0x00, 0x02, 0x02, 0x00, 0x01, 0x02,
+    0x01, 0x01, 0x02, 0x02, 0x02, 0x00, 0x01, 0x02, 0x00, 0x02, 0x03, 0x01, 0x02, 0x03, 0x02, 0x02,
+    0x02, 0x01, 0x01, 0x02, 0x01, 0x02, 0x02, 0x02, 0x01,
+    // G: edges @ 977
+    0x00, 0x01, 0x00, 0x04, 0x00, 0x0a, 0x01, 0x05, 0x01, 0x0b, 0x02, 0x03, 0x02, 0x04, 0x02, 0x0c,
+    0x03, 0x05, 0x03, 0x0d, 0x04, 0x05, 0x06, 0x07, 0x06, 0x08, 0x06, 0x0e, 0x07, 0x09, 0x07, 0x0f,
+    0x08, 0x09, 0x08, 0x10, 0x09, 0x12, 0x0a, 0x0b, 0x0a, 0x12, 0x0b, 0x0f, 0x0c, 0x0d, 0x0c, 0x10,
+    0x0d, 0x11, 0x0e, 0x0f, 0x0e, 0x11, 0x10, 0x11, 0x10, 0x12,
+    // G: face vertices @ 1035
+    0x00, 0x01, 0x05, 0x04, 0x04, 0x05, 0x03, 0x02, 0x09, 0x12, 0x10, 0x08, 0x07, 0x09, 0x08, 0x06,
+    0x0a, 0x0b, 0x01, 0x00, 0x05, 0x01, 0x0b, 0x0f, 0x0e, 0x11, 0x0d, 0x03, 0x0c, 0x0d, 0x11, 0x10,
+    0x08, 0x10, 0x11, 0x0e, 0x06, 0x00, 0x04, 0x02, 0x0c, 0x10, 0x12, 0x0a, 0x02, 0x03, 0x0d, 0x0c,
+    0x06, 0x0e, 0x0f, 0x07, 0x07, 0x0f, 0x0b, 0x0a, 0x12, 0x09,
+    // G: face vertex counts @ 1093
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x08, 0x04, 0x05, 0x07, 0x04, 0x04, 0x06,
+    // G': vertices @ 1105
+    0x02, 0x01, 0x01, 0x02, 0x01, 0x02, 0x03, 0x00, 0x01, 0x03, 0x00, 0x02, 0x03, 0x01, 0x01, 0x03,
+    0x01, 0x02, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x01, 0x00, 0x01, 0x02, 0x00, 0x02, 0x02,
+    0x01, 0x02, 0x02, 0x02, 0x01, 0x00, 0x01, 0x01, 0x00, 0x02, 0x00, 0x01, 0x02, 0x00, 0x02, 0x02,
+    0x01, 0x01, 0x01, 0x01, 0x01, 0x02, 0x01, 0x02, 0x01,
+    // G': edges @ 1162
+    0x00, 0x01, 0x00, 0x04, 0x00, 0x0a, 0x01, 0x05, 0x01, 0x0b, 0x02, 0x03, 0x02, 0x04, 0x02, 0x0c,
+    0x03, 0x05, 0x03, 0x0d, 0x04, 0x05, 0x06, 0x07, 0x06, 0x08, 0x06, 0x0e, 0x07, 0x09, 0x07, 0x0f,
+    0x08, 0x09, 0x08, 0x10, 0x09, 0x12, 0x0a, 0x0b, 0x0a, 0x12, 0x0b, 0x0f, 0x0c, 0x0d, 0x0c, 0x10,
+    0x0d, 0x11, 0x0e, 0x0f, 0x0e, 0x11, 0x10, 0x11, 0x10, 0x12,
+    // G': face vertices @ 1220
+    0x00, 0x04, 0x05, 0x01, 0x04, 0x02, 0x03, 0x05, 0x09, 0x08, 0x10, 0x12, 0x07, 0x06, 0x08, 0x09,
+    0x0a, 0x00, 0x01, 0x0b, 0x05, 0x03, 0x0d, 0x11, 0x0e, 0x0f, 0x0b, 0x01, 0x0c, 0x10, 0x11, 0x0d,
+    0x08, 0x06, 0x0e, 0x11, 0x10, 0x00, 0x0a, 0x12, 0x10, 0x0c, 0x02, 0x04, 0x02, 0x0c, 0x0d, 0x03,
+    0x06, 0x07, 0x0f, 0x0e, 0x07, 0x09, 0x12, 0x0a, 0x0b, 0x0f,
+    // G': face vertex counts @ 1278
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x08, 0x04, 0x05, 0x07, 0x04, 0x04, 0x06,
+    // H: vertices @ 1290
+    0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x01, 0x01, 0x00, 0x01, 0x01, 0x00, 0x02, 0x01, 0x02,
+    0x01, 0x00, 0x02, 0x02, 0x00, 0x02, 0x01, 0x01, 0x02, 0x02, 0x01, 0x03, 0x02, 0x02, 0x03, 0x02,
+    0x01, 0x01, 0x01, 0x02, 0x01, 0x02, 0x02, 0x01, 0x02, 0x01, 0x03, 0x00, 0x02, 0x02, 0x00, 0x02,
+    0x02, 0x01, 0x02, 0x03, 0x00, 0x01, 0x02, 0x00, 0x01,
+    // H: edges @ 1347
+    0x00, 0x01, 0x00, 0x03, 0x00, 0x05, 0x01, 0x04, 0x01, 0x06, 0x02, 0x03, 0x02, 0x0b, 0x02, 0x0d,
+    0x03, 0x04, 0x04, 0x0d, 0x05, 0x06, 0x05, 0x07, 0x06, 0x08, 0x07, 0x08, 0x07, 0x10, 0x07, 0x12,
+    0x08, 0x0a, 0x09, 0x0a, 0x09, 0x0c, 0x09, 0x0e, 0x0a, 0x11, 0x0b, 0x0c, 0x0b, 0x10, 0x0c, 0x0d,
+    0x0e, 0x0f, 0x0e, 0x11, 0x0f, 0x10, 0x0f, 0x12, 0x11, 0x12,
+    // H: face vertices @ 1405
+    0x0d, 0x04, 0x03, 0x02, 0x0a, 0x08, 0x07, 0x12, 0x11, 0x04, 0x01, 0x00, 0x03, 0x05, 0x00, 0x01,
+    0x06, 0x06, 0x08, 0x07, 0x05, 0x01, 0x04, 0x0d, 0x0c, 0x09, 0x0a, 0x08, 0x06, 0x02, 0x03, 0x00,
+    0x05, 0x07, 0x10, 0x0b, 0x0d, 0x0c, 0x0b, 0x02, 0x09, 0x0a, 0x11, 0x0e, 0x11, 0x12, 0x0f, 0x0e,
+    0x10, 0x0b, 0x0c, 0x09, 0x0e, 0x0f, 0x07, 0x10, 0x0f, 0x12,
+    // H: face vertex counts @ 1463
+    0x04, 0x05, 0x04, 0x04, 0x04, 0x08, 0x07, 0x04, 0x04, 0x04, 0x06, 0x04,
+    // H': vertices @ 1475
+    0x03, 0x01, 0x00, 0x03, 0x02, 0x00, 0x02, 0x01, 0x01, 0x03, 0x01, 0x01, 0x03, 0x02, 0x01, 0x01,
+    0x01, 0x00, 0x01, 0x02, 0x00, 0x01, 0x01, 0x01, 0x01, 0x02, 0x01, 0x00, 0x02, 0x02, 0x00, 0x02,
+    0x01, 0x02, 0x01, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x01, 0x00, 0x00, 0x02, 0x01, 0x00, 0x02,
+    0x01, 0x01, 0x02, 0x00, 0x00, 0x01, 0x01, 0x00, 0x01,
+    // H': edges @ 1532
+    0x00, 0x01, 0x00, 0x03, 0x00, 0x05, 0x01, 0x04, 0x01, 0x06, 0x02, 0x03, 0x02, 0x0b, 0x02, 0x0d,
+    0x03, 0x04, 0x04, 0x0d, 0x05, 0x06, 0x05, 0x07, 0x06, 0x08, 0x07, 0x08, 0x07, 0x10, 0x07, 0x12,
+    0x08, 0x0a, 0x09, 0x0a, 0x09, 0x0c, 0x09, 0x0e, 0x0a, 0x11, 0x0b, 0x0c, 0x0b, 0x10, 0x0c, 0x0d,
+    0x0e, 0x0f, 0x0e, 0x11, 0x0f, 0x10, 0x0f, 0x12, 0x11, 0x12,
+    // H': face vertices @ 1590
+    0x0d, 0x02, 0x03, 0x04, 0x0a, 0x11, 0x12, 0x07, 0x08, 0x04, 0x03, 0x00, 0x01, 0x05, 0x06, 0x01,
+    0x00, 0x06, 0x05, 0x07, 0x08, 0x01, 0x06, 0x08, 0x0a, 0x09, 0x0c, 0x0d, 0x04, 0x02, 0x0b, 0x10,
+    0x07, 0x05, 0x00, 0x03, 0x0d, 0x02, 0x0b, 0x0c, 0x09, 0x0e, 0x11, 0x0a, 0x11, 0x0e, 0x0f, 0x12,
+    0x10, 0x0f, 0x0e, 0x09, 0x0c, 0x0b, 0x07, 0x12, 0x0f, 0x10,
+    // H': face vertex counts @ 1648
+    0x04, 0x05, 0x04, 0x04, 0x04, 0x08, 0x07, 0x04, 0x04, 0x04, 0x06, 0x04,
+    // I: vertices @ 1660
+    0x05, 0x00, 0x01, 0x05, 0x01, 0x01, 0x05, 0x00, 0x00, 0x05, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00,
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00,
+    // I: edges @ 1684
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x04, 0x01, 0x03, 0x01, 0x05, 0x02, 0x03, 0x02, 0x06, 0x03, 0x07,
+    0x04, 0x05, 0x04, 0x06, 0x05, 0x07, 0x06, 0x07,
+    // I: face vertices @ 1708
+    0x02, 0x03, 0x01, 0x00, 0x02, 0x00, 0x04, 0x06, 0x04, 0x05, 0x07, 0x06, 0x03, 0x02, 0x06, 0x07,
+    0x01, 0x05, 0x04, 0x00, 0x03, 0x07, 0x05, 0x01,
+    // I: face vertex counts @ 1732
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04,
+    // J: vertices @ 1738
+    0x01, 0x00, 0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x01, 0x00, 0x01, 0x01, 0x01, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x03, 0x01, 0x02, 0x01, 0x01, 0x01, 0x03, 0x02, 0x02, 0x03, 0x01, 0x01, 0x03, 0x02,
+    0x01, 0x00, 0x01, 0x02, 0x00, 0x02, 0x02, 0x01, 0x01, 0x01, 0x00, 0x01, 0x01, 0x01, 0x02, 0x01,
+    0x00, 0x01, 0x01, 0x01, 0x02, 0x00, 0x00, 0x02, 0x00,
+    // J: edges @ 1795
+    0x00, 0x02, 0x00, 0x04, 0x00, 0x0d, 0x02, 0x05, 0x02, 0x10, 0x04, 0x05, 0x04, 0x11, 0x05, 0x12,
+    0x06, 0x08, 0x06, 0x09, 0x06, 0x0b, 0x08, 0x0a, 0x08, 0x0c, 0x09, 0x0a, 0x09, 0x0d, 0x0a, 0x0f,
+    0x0b, 0x0c, 0x0b, 0x10, 0x0c, 0x12, 0x0d, 0x0f, 0x0d, 0x10, 0x0f, 0x11, 0x11, 0x12,
+    // J: face vertices @ 1841
+    0x02, 0x00, 0x04, 0x05, 0x08, 0x06, 0x09, 0x0a, 0x04, 0x11, 0x12, 0x05, 0x05, 0x12, 0x0c, 0x0b,
+    0x10, 0x02, 0x0f, 0x0a, 0x09, 0x0d, 0x02, 0x10, 0x0d, 0x00, 0x00, 0x0d, 0x0f, 0x11, 0x04, 0x0a,
+    0x0f, 0x11, 0x12, 0x0c, 0x08, 0x08, 0x0c, 0x0b, 0x06, 0x10, 0x0b, 0x06, 0x09, 0x0d,
+    // J: face vertex counts @ 1887
+    0x04, 0x04, 0x04, 0x06, 0x04, 0x04, 0x05, 0x06, 0x04, 0x05,
+    // J': vertices @ 1897
+    0x02, 0x02, 0x01, 0x02, 0x01, 0x01, 0x03, 0x02, 0x01, 0x03, 0x01, 0x01, 0x02, 0x02, 0x02, 0x03,
+    0x02, 0x02, 0x00, 0x01, 0x00, 0x02, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00,
+    0x01, 0x03, 0x01, 0x00, 0x03, 0x00, 0x00, 0x02, 0x01, 0x01, 0x03, 0x01, 0x01, 0x02, 0x00, 0x01,
+    0x03, 0x01, 0x01, 0x02, 0x00, 0x02, 0x03, 0x00, 0x02,
+    // J': edges @ 1954
+    0x00, 0x02, 0x00, 0x04, 0x00, 0x0d, 0x02, 0x05, 0x02, 0x10, 0x04, 0x05, 0x04, 0x11, 0x05, 0x12,
+    0x06, 0x08, 0x06, 0x09, 0x06, 0x0b, 0x08, 0x0a, 0x08, 0x0c, 0x09, 0x0a, 0x09, 0x0d, 0x0a, 0x0f,
+    0x0b, 0x0c, 0x0b, 0x10, 0x0c, 0x12, 0x0d, 0x0f, 0x0d, 0x10, 0x0f, 0x11, 0x11, 0x12,
+    // J': face vertices @ 2000
+    0x02, 0x05, 0x04, 0x00, 0x08, 0x0a, 0x09, 0x06, 0x04, 0x05, 0x12, 0x11, 0x05, 0x02, 0x10, 0x0b,
+    0x0c, 0x12, 0x0f, 0x0d, 0x09, 0x0a, 0x02, 0x00, 0x0d, 0x10, 0x00, 0x04, 0x11, 0x0f, 0x0d, 0x0a,
+    0x08, 0x0c, 0x12, 0x11, 0x0f, 0x08, 0x06, 0x0b, 0x0c, 0x10, 0x0d, 0x09, 0x06, 0x0b,
+    // J': face vertex counts @ 2046
+    0x04, 0x04, 0x04, 0x06, 0x04, 0x04, 0x05, 0x06, 0x04, 0x05,
+    // K: vertices @ 2056
+    0x02, 0x01, 0x01, 0x02, 0x02, 0x01, 0x03, 0x01, 0x02, 0x03, 0x02, 0x02, 0x03, 0x01, 0x01, 0x03,
+    0x02, 0x01, 0x02, 0x01, 0x02, 0x02, 0x02, 0x02, 0x00, 0x01, 0x02, 0x00, 0x02, 0x02, 0x01, 0x02,
+    0x02, 0x01, 0x01, 0x01, 0x01, 0x02, 0x01, 0x00, 0x02, 0x01, 0x01, 0x01, 0x00, 0x01, 0x02, 0x00,
+    0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x00, 0x02, 0x01, 0x01, 0x02, 0x00, 0x00, 0x02, 0x01,
+    0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x01, 0x01,
+    // K: edges @ 2128
+    0x00, 0x04, 0x00, 0x0b, 0x01, 0x05, 0x01, 0x0c, 0x02, 0x03, 0x02, 0x04, 0x02, 0x06, 0x03, 0x05,
+    0x03, 0x07, 0x04, 0x05, 0x06, 0x13, 0x07, 0x0a, 0x08, 0x09, 0x08, 0x14, 0x09, 0x0a, 0x09, 0x0d,
+    0x0b, 0x0c, 0x0b, 0x0e, 0x0b, 0x13, 0x0b, 0x15, 0x0b, 0x17, 0x0c, 0x0f, 0x0d, 0x11, 0x0e, 0x0f,
+    0x0e, 0x10, 0x0f, 0x11, 0x10, 0x11, 0x10, 0x17, 0x12, 0x13, 0x12, 0x14, 0x12, 0x15, 0x14, 0x16,
+    0x15, 0x16, 0x16, 0x17,
+    // K: face vertices @ 2196
+    0x00, 0x04, 0x02, 0x06, 0x13, 0x0b, 0x04, 0x05, 0x03, 0x02, 0x01, 0x05, 0x04, 0x00, 0x0b, 0x0c,
+    0x10, 0x11, 0x0f, 0x0e, 0x0e, 0x0f, 0x0c, 0x0b, 0x17, 0x10, 0x0e, 0x0b, 0x08, 0x09, 0x0d, 0x11,
+    0x10, 0x17, 0x16, 0x14, 0x05, 0x01, 0x0c, 0x0f, 0x11, 0x0d, 0x09, 0x0a, 0x07, 0x03, 0x16, 0x17,
+    0x0b, 0x15, 0x15, 0x0b, 0x13, 0x12, 0x14, 0x16, 0x15, 0x12, 0x02, 0x03, 0x07, 0x0a, 0x09, 0x08,
+    0x14, 0x12, 0x13, 0x06,
+    // K: face vertex counts @ 2264
+    0x06, 0x04, 0x06, 0x04, 0x04, 0x04, 0x08, 0x0a, 0x04, 0x04, 0x04, 0x0a,
+    // L: vertices @ 2276
+    0x04, 0x00, 0x02, 0x04, 0x01, 0x02, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x00, 0x00, 0x01, 0x00,
+    0x01, 0x01, 0x03, 0x00, 0x01, 0x03, 0x01, 0x01, 0x04, 0x00, 0x00, 0x04, 0x01, 0x00, 0x03, 0x00,
+    0x00, 0x03, 0x01, 0x00,
+    // L: edges @ 2312
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x08, 0x01, 0x03, 0x01, 0x09, 0x02, 0x03, 0x02, 0x04, 0x03, 0x05,
+    0x04, 0x05, 0x04, 0x06, 0x05, 0x07, 0x06, 0x07, 0x06, 0x0a, 0x07, 0x0b, 0x08, 0x09, 0x08, 0x0a,
+    0x09, 0x0b, 0x0a, 0x0b,
+    // L: face vertices @ 2348
+    0x00, 0x01, 0x03, 0x02, 0x02, 0x03, 0x05, 0x04, 0x09, 0x01, 0x00, 0x08, 0x08, 0x00, 0x02, 0x04,
+    0x06, 0x0a, 0x06, 0x07, 0x0b, 0x0a, 0x0a, 0x0b, 0x09, 0x08, 0x07, 0x06, 0x04, 0x05, 0x01, 0x09,
+    0x0b, 0x07, 0x05, 0x03,
+    // L: face vertex counts @ 2384
+    0x04, 0x04, 0x04, 0x06, 0x04, 0x04, 0x04, 0x06,
+    // M: vertices @ 2392
+    0x02, 0x02, 0x02, 0x02, 0x02, 0x01, 0x03, 0x01, 0x02, 0x03, 0x02, 0x02, 0x03, 0x01, 0x01, 0x03,
+    0x02, 0x01, 0x02, 0x01, 0x02, 0x00, 0x01, 0x02, 0x00, 0x02, 0x02, 0x00, 0x01, 0x01, 0x00, 0x02,
+    0x01, 0x01, 0x02, 0x02, 0x01, 0x02, 0x01, 0x02, 0x01, 0x00, 0x02, 0x02, 0x00, 0x01, 0x01, 0x00,
+    0x01, 0x02, 0x00, 0x02, 0x00, 0x02, 0x01, 0x00, 0x02, 0x01, 0x01, 0x02, 0x02, 0x00, 0x01, 0x02,
+    0x01, 0x01, 0x01, 0x00, 0x01, 0x01, 0x01, 0x01,
+    // M: edges @ 2464
+    0x00, 0x03, 0x00, 0x0b, 0x01, 0x05, 0x01, 0x0e, 0x01, 0x15, 0x02, 0x03, 0x02, 0x04, 0x02, 0x06,
+    0x03, 0x05, 0x04, 0x05, 0x04, 0x15, 0x06, 0x11, 0x06, 0x15, 0x07, 0x08, 0x07, 0x09, 0x07, 0x13,
+    0x08, 0x0a, 0x08, 0x0b, 0x09, 0x0a, 0x09, 0x17, 0x0a, 0x0c, 0x0c, 0x10, 0x0c, 0x17, 0x0d, 0x0e,
+    0x0d, 0x0f, 0x0d, 0x15, 0x0e, 0x10, 0x0f, 0x10, 0x0f, 0x17, 0x11, 0x12, 0x11, 0x14, 0x12, 0x13,
+    0x12, 0x16, 0x13, 0x17, 0x14, 0x15, 0x14, 0x16, 0x15, 0x17, 0x16, 0x17,
+    // M: face vertices @ 2540
+    0x15, 0x01, 0x05, 0x04, 0x04, 0x05, 0x03, 0x02, 0x15, 0x04, 0x02, 0x06, 0x07, 0x08, 0x0a, 0x09,
+    0x09, 0x0a, 0x0c, 0x17, 0x09, 0x17, 0x13, 0x07, 0x17, 0x0c, 0x10, 0x0f, 0x0f, 0x10, 0x0e, 0x0d,
+    0x0d, 0x0e, 0x01, 0x15, 0x17, 0x0f, 0x0d, 0x15, 0x05, 0x01, 0x0e, 0x10, 0x0c, 0x0a, 0x08, 0x0b,
+    0x00, 0x03, 0x12, 0x13, 0x17, 0x16, 0x16, 0x17, 0x15, 0x14, 0x14, 0x15, 0x06, 0x11, 0x12, 0x16,
+    0x14, 0x11, 0x02, 0x03, 0x00, 0x0b, 0x08, 0x07, 0x13, 0x12, 0x11, 0x06,
+    // M: face vertex counts @ 2616
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0a, 0x04, 0x04, 0x04, 0x04, 0x0a,
+    // N: vertices @ 2632
+    0x00, 0x00, 0x01, 0x00, 0x01, 0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x02,
+    0x00, 0x01, 0x02, 0x01, 0x01, 0x02, 0x00, 0x02, 0x02, 0x01, 0x02, 0x04, 0x00, 0x00, 0x04, 0x01,
+    0x00, 0x04, 0x00, 0x01, 0x04, 0x01, 0x01, 0x01, 0x00, 0x00, 0x01, 0x01, 0x00, 0x01, 0x00, 0x01,
+    // N: edges @ 2680
+    0x00, 0x01, 0x00, 0x03, 0x00, 0x0f, 0x01, 0x02, 0x01, 0x04, 0x02, 0x0e, 0x02, 0x0f, 0x03, 0x04,
+    0x03, 0x07, 0x04, 0x08, 0x05, 0x06, 0x05, 0x07, 0x05, 0x0b, 0x06, 0x08, 0x06, 0x0c, 0x07, 0x08,
+    0x09, 0x0a, 0x09, 0x0b, 0x09, 0x0d, 0x0a, 0x0c, 0x0a, 0x0e, 0x0b, 0x0c, 0x0d, 0x0e, 0x0d, 0x0f,
+    // N: face vertices @ 2728
+    0x00, 0x01, 0x02, 0x0f, 0x03, 0x04, 0x01, 0x00, 0x05, 0x06, 0x08, 0x07, 0x06, 0x05, 0x0b, 0x0c,
+    0x09, 0x0a, 0x0c, 0x0b, 0x03, 0x00, 0x0f, 0x0d, 0x09, 0x0b, 0x05, 0x07, 0x0f, 0x02, 0x0e, 0x0d,
+    0x04, 0x03, 0x07, 0x08, 0x0e, 0x0a, 0x09, 0x0d, 0x02, 0x01, 0x04, 0x08, 0x06, 0x0c, 0x0a, 0x0e,
+    // N: face vertex counts @ 2776
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x08, 0x04, 0x04, 0x04, 0x08,
+    // P: vertices @ 2786
+    0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x03, 0x00, 0x02, 0x03, 0x01, 0x02, 0x03, 0x00, 0x01, 0x03,
+    0x01, 0x01, 0x02, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x02, 0x01, 0x01, 0x02, 0x00,
+    0x00, 0x02, 0x01, 0x00,
+    // P: edges @ 2822
+    0x00, 0x01, 0x00, 0x07, 0x00, 0x0a, 0x01, 0x08, 0x01, 0x0b, 0x02, 0x03, 0x02, 0x04, 0x02, 0x07,
+    0x03, 0x05, 0x03, 0x08, 0x04, 0x05, 0x04, 0x06, 0x05, 0x09, 0x06, 0x09, 0x06, 0x0a, 0x07, 0x08,
+    0x09, 0x0b, 0x0a, 0x0b,
+    // P: face vertices @ 2858
+    0x06, 0x09, 0x05, 0x04, 0x04, 0x05, 0x03, 0x02, 0x02, 0x03, 0x08, 0x07, 0x07, 0x00, 0x0a, 0x06,
+    0x04, 0x02, 0x08, 0x01, 0x00, 0x07, 0x0a, 0x0b, 0x09, 0x06, 0x01, 0x08, 0x03, 0x05, 0x09, 0x0b,
+    0x00, 0x01, 0x0b, 0x0a,
+    // P: face vertex counts @ 2894
+    0x04, 0x04, 0x04, 0x06, 0x04, 0x04, 0x06, 0x04,
+    // Q: vertices @ 2902
+    0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x02, 0x01, 0x01, 0x02, 0x02, 0x01, 0x01, 0x02, 0x01, 0x02,
+    0x02, 0x00, 0x01, 0x01, 0x00, 0x01, 0x02, 0x00, 0x02, 0x00, 0x02, 0x02, 0x01, 0x02, 0x00, 0x00,
+    0x00, 0x00, 0x01, 0x00, 0x01, 0x01, 0x01, 0x02, 0x00, 0x00,
+    // Q: edges @ 2944
+    0x00, 0x01, 0x00, 0x08, 0x00, 0x0a, 0x01, 0x09, 0x01, 0x0b, 0x02, 0x03, 0x02, 0x09, 0x02, 0x0c,
+    0x03, 0x04, 0x03, 0x05, 0x04, 0x07, 0x04, 0x0c, 0x05, 0x07, 0x05, 0x0d, 0x06, 0x07, 0x06, 0x0b,
+    0x06, 0x0c, 0x08, 0x09, 0x08, 0x0d, 0x0a, 0x0b, 0x0a, 0x0d,
+    // Q: face vertices @ 2986
+    0x02, 0x03, 0x04, 0x0c, 0x0c, 0x04, 0x07, 0x06, 0x07, 0x04, 0x03, 0x05, 0x05, 0x03, 0x02, 0x09,
+    0x08, 0x0d, 0x06, 0x07, 0x05, 0x0d, 0x0a, 0x0b, 0x01, 0x00, 0x08, 0x09, 0x00, 0x01, 0x0b, 0x0a,
+    0x00, 0x0a, 0x0d, 0x08, 0x01, 0x09, 0x02, 0x0c, 0x06, 0x0b,
+    // Q: face vertex counts @ 3028
+    0x04, 0x04, 0x04, 0x06, 0x06, 0x04, 0x04, 0x04, 0x06,
+    // R: vertices @ 3037
+    0x03, 0x01, 0x01, 0x03, 0x02, 0x01, 0x03, 0x01, 0x02, 0x03, 0x02, 0x02, 0x02, 0x01, 0x02, 0x01,
+    0x02, 0x02, 0x02, 0x02, 0x01, 0x02, 0x01, 0x00, 0x02, 0x02, 0x00, 0x02, 0x01, 0x01, 0x00, 0x01,
+    0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x01, 0x00, 0x02, 0x01, 0x01, 0x02, 0x01, 0x02, 0x00, 0x01,
+    0x01, 0x00, 0x01, 0x01, 0x01, 0x01, 0x02, 0x00, 0x02, 0x01, 0x00, 0x02,
+    // R: edges @ 3097
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x09, 0x01, 0x03, 0x01, 0x06, 0x02, 0x03, 0x02, 0x04, 0x03, 0x05,
+    0x04, 0x09, 0x04, 0x12, 0x05, 0x0e, 0x05, 0x13, 0x06, 0x08, 0x06, 0x09, 0x07, 0x08, 0x07, 0x09,
+    0x07, 0x0a, 0x08, 0x0b, 0x09, 0x0f, 0x09, 0x11, 0x0a, 0x0b, 0x0a, 0x0c, 0x0b, 0x0d, 0x0c, 0x0d,
+    0x0c, 0x11, 0x0d, 0x0e, 0x0e, 0x11, 0x0f, 0x10, 0x0f, 0x12, 0x10, 0x11, 0x10, 0x13, 0x12, 0x13,
+    // R: face vertices @ 3161
+    0x00, 0x09, 0x06, 0x01, 0x02, 0x00, 0x01, 0x03, 0x09, 0x00, 0x02, 0x04, 0x09, 0x07, 0x08, 0x06,
+    0x0a, 0x0c, 0x0d, 0x0b, 0x0c, 0x11, 0x0e, 0x0d, 0x11, 0x0c, 0x0a, 0x07, 0x09, 0x11, 0x10, 0x13,
+    0x05, 0x0e, 0x0f, 0x10, 0x11, 0x09, 0x07, 0x0a, 0x0b, 0x08, 0x06, 0x08, 0x0b, 0x0d, 0x0e, 0x05,
+    0x03, 0x01, 0x12, 0x0f, 0x09, 0x04, 0x10, 0x0f, 0x12, 0x13, 0x03, 0x05, 0x13, 0x12, 0x04, 0x02,
+    // R: face vertex counts @ 3225
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x05, 0x05, 0x04, 0x04, 0x08, 0x04, 0x04, 0x06,
+    // R': vertices @ 3239
+    0x00, 0x01, 0x01, 0x00, 0x02, 0x01, 0x00, 0x01, 0x02, 0x00, 0x02, 0x02, 0x01, 0x01, 0x02, 0x02,
+    0x02, 0x02, 0x01, 0x02, 0x01, 0x01, 0x01, 0x00, 0x01, 0x02, 0x00, 0x01, 0x01, 0x01, 0x03, 0x01,
+    0x00, 0x03, 0x02, 0x00, 0x03, 0x01, 0x01, 0x03, 0x02, 0x01, 0x02, 0x02, 0x01, 0x01, 0x00, 0x01,
+    0x02, 0x00, 0x01, 0x02, 0x01, 0x01, 0x01, 0x00, 0x02, 0x02, 0x00, 0x02,
+    // R': edges @ 3299
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x09, 0x01, 0x03, 0x01, 0x06, 0x02, 0x03, 0x02, 0x04, 0x03, 0x05,
+    0x04, 0x09, 0x04, 0x12, 0x05, 0x0e, 0x05, 0x13, 0x06, 0x08, 0x06, 0x09, 0x07, 0x08, 0x07, 0x09,
+    0x07, 0x0a, 0x08, 0x0b, 0x09, 0x0f, 0x09, 0x11, 0x0a, 0x0b, 0x0a, 0x0c, 0x0b, 0x0d, 0x0c, 0x0d,
+    0x0c, 0x11, 0x0d, 0x0e, 0x0e, 0x11, 0x0f, 0x10, 0x0f, 0x12, 0x10, 0x11, 0x10, 0x13, 0x12, 0x13,
+    // R': face vertices @ 3363
+    0x00, 0x01, 0x06, 0x09, 0x02, 0x03, 0x01, 0x00, 0x09, 0x04, 0x02, 0x00, 0x09, 0x06, 0x08, 0x07,
+    0x0a, 0x0b, 0x0d, 0x0c, 0x0c, 0x0d, 0x0e, 0x11, 0x11, 0x09, 0x07, 0x0a, 0x0c, 0x11, 0x0e, 0x05,
+    0x13, 0x10, 0x0f, 0x09, 0x11, 0x10, 0x07, 0x08, 0x0b, 0x0a, 0x06, 0x01, 0x03, 0x05, 0x0e, 0x0d,
+    0x0b, 0x08, 0x12, 0x04, 0x09, 0x0f, 0x10, 0x13, 0x12, 0x0f, 0x03, 0x02, 0x04, 0x12, 0x13, 0x05,
+    // R': face vertex counts @ 3427
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x05, 0x05, 0x04, 0x04, 0x08, 0x04, 0x04, 0x06,
+    // S: vertices @ 3441
+    0x00, 0x02, 0x02, 0x00, 0x02, 0x01, 0x02, 0x01, 0x01, 0x03, 0x01, 0x02, 0x02, 0x02, 0x01, 0x02,
+    0x01, 0x00, 0x02, 0x02, 0x00, 0x03, 0x01, 0x00, 0x00, 0x00, 0x02, 0x01, 0x00, 0x02, 0x01, 0x00,
+    0x01, 0x03, 0x02, 0x02, 0x03, 0x02, 0x00, 0x01, 0x01, 0x02, 0x00, 0x00, 0x01, 0x01, 0x01, 0x01,
+    // S: edges @ 3489
+    0x00, 0x01, 0x00, 0x08, 0x00, 0x0b, 0x01, 0x04, 0x01, 0x0e, 0x02, 0x04, 0x02, 0x05, 0x02, 0x0f,
+    0x03, 0x07, 0x03, 0x0b, 0x03, 0x0d, 0x04, 0x06, 0x05, 0x06, 0x05, 0x07, 0x06, 0x0c, 0x07, 0x0c,
+    0x08, 0x09, 0x08, 0x0e, 0x09, 0x0a, 0x09, 0x0d, 0x0a, 0x0e, 0x0a, 0x0f, 0x0b, 0x0c, 0x0d, 0x0f,
+    // S: face vertices @ 3537
+    0x09, 0x0a, 0x0f, 0x0d, 0x07, 0x03, 0x0d, 0x0f, 0x02, 0x05, 0x07, 0x05, 0x06, 0x0c, 0x05, 0x02,
+    0x04, 0x06, 0x00, 0x08, 0x09, 0x0d, 0x03, 0x0b, 0x01, 0x04, 0x02, 0x0f, 0x0a, 0x0e, 0x03, 0x07,
+    0x0c, 0x0b, 0x01, 0x0e, 0x08, 0x00, 0x09, 0x08, 0x0e, 0x0a, 0x01, 0x00, 0x0b, 0x0c, 0x06, 0x04,
+    // S: face vertex counts @ 3585
+    0x04, 0x06, 0x04, 0x04, 0x06, 0x06, 0x04, 0x04, 0x04, 0x06,
+    // S': vertices @ 3595
+    0x03, 0x02, 0x02, 0x03, 0x02, 0x01, 0x01, 0x01, 0x01, 0x00, 0x01, 0x02, 0x01, 0x02, 0x01, 0x01,
+    0x01, 0x00, 0x01, 0x02, 0x00, 0x00, 0x01, 0x00, 0x03, 0x00, 0x02, 0x02, 0x00, 0x02, 0x02, 0x00,
+    0x01, 0x00, 0x02, 0x02, 0x00, 0x02, 0x00, 0x02, 0x01, 0x02, 0x03, 0x00, 0x01, 0x02, 0x01, 0x01,
+    // S': edges @ 3643
+    0x00, 0x01, 0x00, 0x08, 0x00, 0x0b, 0x01, 0x04, 0x01, 0x0e, 0x02, 0x04, 0x02, 0x05, 0x02, 0x0f,
+    0x03, 0x07, 0x03, 0x0b, 0x03, 0x0d, 0x04, 0x06, 0x05, 0x06, 0x05, 0x07, 0x06, 0x0c, 0x07, 0x0c,
+    0x08, 0x09, 0x08, 0x0e, 0x09, 0x0a, 0x09, 0x0d, 0x0a, 0x0e, 0x0a, 0x0f, 0x0b, 0x0c, 0x0d, 0x0f,
+    // S': face vertices @ 3691
+    0x09, 0x0d, 0x0f, 0x0a, 0x07, 0x05, 0x02, 0x0f, 0x0d, 0x03, 0x07, 0x0c, 0x06, 0x05, 0x05, 0x06,
+    0x04, 0x02, 0x00, 0x0b, 0x03, 0x0d, 0x09, 0x08, 0x01, 0x0e, 0x0a, 0x0f, 0x02, 0x04, 0x03, 0x0b,
+    0x0c, 0x07, 0x01, 0x00, 0x08, 0x0e, 0x09, 0x0a, 0x0e, 0x08, 0x01, 0x04, 0x06, 0x0c, 0x0b, 0x00,
+    // S': face vertex counts @ 3739
+    0x04, 0x06, 0x04, 0x04, 0x06, 0x06, 0x04, 0x04, 0x04, 0x06,
+    // T: vertices @ 3749
+    0x01, 0x00, 0x01, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x00, 0x00, 0x01, 0x01, 0x01, 0x01,
+    0x01, 0x00, 0x02, 0x01, 0x01, 0x02, 0x01, 0x00, 0x00, 0x02, 0x01, 0x00, 0x02, 0x00, 0x01, 0x02,
+    0x01, 0x01, 0x02, 0x00, 0x00, 0x03, 0x01, 0x00, 0x03, 0x00, 0x01, 0x03, 0x01, 0x01, 0x03, 0x00,
+    0x02, 0x03, 0x01, 0x02, 0x03, 0x00, 0x02, 0x02, 0x01, 0x02, 0x02, 0x00, 0x03, 0x03, 0x01, 0x03,
+    0x03, 0x00, 0x03, 0x02, 0x01, 0x03, 0x02, 0x00,
+    // T: edges @ 3821
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x04, 0x01, 0x03, 0x01, 0x05, 0x02, 0x03, 0x02, 0x06, 0x03, 0x07,
+    0x04, 0x0a, 0x05, 0x0b, 0x06, 0x12, 0x07, 0x13, 0x08, 0x09, 0x08, 0x0a, 0x08, 0x0c, 0x09, 0x0b,
+    0x09, 0x0d, 0x0a, 0x0b, 0x0c, 0x0d, 0x0c, 0x0e, 0x0d, 0x0f, 0x0e, 0x10, 0x0f, 0x11, 0x10, 0x14,
+    0x11, 0x15, 0x12, 0x13, 0x12, 0x16, 0x13, 0x17, 0x14, 0x15, 0x14, 0x16, 0x15, 0x17, 0x16, 0x17,
+    // T: face vertices @ 3885
+    0x00, 0x01, 0x03, 0x02, 0x0f, 0x0d, 0x0c, 0x0e, 0x10, 0x14, 0x15, 0x11, 0x02, 0x06, 0x12, 0x16,
+    0x14, 0x10, 0x0e, 0x0c, 0x08, 0x0a, 0x04, 0x00, 0x08, 0x09, 0x0b, 0x0a, 0x0c, 0x0d, 0x09, 0x08,
+    0x12, 0x13, 0x17, 0x16, 0x16, 0x17, 0x15, 0x14, 0x05, 0x01, 0x00, 0x04, 0x0a, 0x0b, 0x02, 0x03,
+    0x07, 0x13, 0x12, 0x06, 0x07, 0x03, 0x01, 0x05, 0x0b, 0x09, 0x0d, 0x0f, 0x11, 0x15, 0x17, 0x13,
+    // T: face vertex counts @ 3949
+    0x04, 0x08, 0x0c, 0x04, 0x04, 0x04, 0x04, 0x06, 0x06, 0x0c,
+    // U: vertices @ 3959
+    0x00, 0x00, 0x01, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x02, 0x00, 0x03, 0x02,
+    0x01, 0x03, 0x00, 0x00, 0x03, 0x00, 0x01, 0x03, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x01, 0x00,
+    0x02, 0x01, 0x01, 0x02, 0x02, 0x00, 0x00, 0x02, 0x01, 0x00, 0x01, 0x00, 0x01, 0x01, 0x01, 0x01,
+    // U: edges @ 4007
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x0e, 0x01, 0x03, 0x01, 0x0f, 0x02, 0x03, 0x02, 0x0c, 0x03, 0x0d,
+    0x04, 0x05, 0x04, 0x06, 0x04, 0x0c, 0x05, 0x07, 0x05, 0x0d, 0x06, 0x07, 0x06, 0x08, 0x07, 0x09,
+    0x08, 0x09, 0x08, 0x0a, 0x09, 0x0b, 0x0a, 0x0b, 0x0a, 0x0e, 0x0b, 0x0f, 0x0c, 0x0d, 0x0e, 0x0f,
+    // U: face vertices @ 4055
+    0x00, 0x01, 0x03, 0x02, 0x0e, 0x0f, 0x01, 0x00, 0x06, 0x07, 0x09, 0x08, 0x08, 0x09, 0x0b, 0x0a,
+    0x0d, 0x05, 0x04, 0x0c, 0x02, 0x0c, 0x04, 0x06, 0x08, 0x0a, 0x0e, 0x00, 0x0a, 0x0b, 0x0f, 0x0e,
+    0x02, 0x03, 0x0d, 0x0c, 0x04, 0x05, 0x07, 0x06, 0x03, 0x01, 0x0f, 0x0b, 0x09, 0x07, 0x05, 0x0d,
+    // U: face vertex counts @ 4103
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x08, 0x04, 0x04, 0x04, 0x08,
+    // V: vertices @ 4113
+    0x01, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x03, 0x00, 0x03, 0x03,
+    0x01, 0x03, 0x03, 0x00, 0x02, 0x03, 0x01, 0x02, 0x01, 0x00, 0x02, 0x01, 0x01, 0x02, 0x00, 0x00,
+    0x03, 0x00, 0x01, 0x03, 0x01, 0x00, 0x02, 0x01, 0x01, 0x02, 0x01, 0x00, 0x02, 0x01, 0x01, 0x02,
+    // V: edges @ 4161
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x0e, 0x01, 0x03, 0x01, 0x0f, 0x02, 0x03, 0x02, 0x0a, 0x03, 0x0b,
+    0x04, 0x05, 0x04, 0x06, 0x04, 0x0a, 0x05, 0x07, 0x05, 0x0b, 0x06, 0x07, 0x06, 0x0e, 0x07, 0x0f,
+    0x0a, 0x0b, 0x0e, 0x0f,
+    // V: face vertices @ 4197
+    0x02, 0x03, 0x01, 0x00, 0x06, 0x07, 0x05, 0x04, 0x00, 0x0e, 0x06, 0x04, 0x0a, 0x02, 0x01, 0x0f,
+    0x0e, 0x00, 0x07, 0x06, 0x0e, 0x0f, 0x05, 0x0b, 0x0a, 0x04, 0x03, 0x02, 0x0a, 0x0b, 0x01, 0x03,
+    0x0b, 0x05, 0x07, 0x0f,
+    // V: face vertex counts @ 4233
+    0x04, 0x04, 0x06, 0x04, 0x04, 0x04, 0x04, 0x06,
+    // W: vertices @ 4241
+    0x03, 0x00, 0x00, 0x03, 0x01, 0x00, 0x02, 0x00, 0x00, 0x02, 0x01, 0x00, 0x01, 0x00, 0x01, 0x01,
+    0x01, 0x01, 0x02, 0x00, 0x01, 0x02, 0x01, 0x01, 0x01, 0x01, 0x02, 0x02, 0x00, 0x03, 0x02, 0x01,
+    0x03, 0x00, 0x00, 0x03, 0x00, 0x01, 0x03, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x01, 0x00, 0x02,
+    0x03, 0x00, 0x02, 0x03, 0x01, 0x02, 0x02, 0x00, 0x02, 0x02, 0x01, 0x02,
+    // W: edges @ 4301
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x10, 0x01, 0x03, 0x01, 0x11, 0x02, 0x03, 0x02, 0x06, 0x03, 0x07,
+    0x04, 0x05, 0x04, 0x06, 0x04, 0x0f, 0x05, 0x07, 0x05, 0x08, 0x06, 0x07, 0x08, 0x0e, 0x08, 0x0f,
+    0x09, 0x0a, 0x09, 0x0b, 0x09, 0x12, 0x0a, 0x0c, 0x0a, 0x13, 0x0b, 0x0c, 0x0b, 0x0d, 0x0c, 0x0e,
+    0x0d, 0x0e, 0x0d, 0x0f, 0x10, 0x11, 0x10, 0x12, 0x11, 0x13, 0x12, 0x13,
+    // W: face vertices @ 4361
+    0x06, 0x07, 0x03, 0x02, 0x02, 0x03, 0x01, 0x00, 0x0f, 0x08, 0x05, 0x04, 0x04, 0x05, 0x07, 0x06,
+    0x12, 0x13, 0x0a, 0x09, 0x0b, 0x0c, 0x0e, 0x0d, 0x0d, 0x0e, 0x08, 0x0f, 0x00, 0x01, 0x11, 0x10,
+    0x10, 0x11, 0x13, 0x12, 0x06, 0x02, 0x00, 0x10, 0x12, 0x09, 0x0b, 0x0d, 0x0f, 0x04, 0x09, 0x0a,
+    0x0c, 0x0b, 0x03, 0x07, 0x05, 0x08, 0x0e, 0x0c, 0x0a, 0x13, 0x11, 0x01,
+    // W: face vertex counts @ 4421
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0a, 0x04, 0x0a,
+    // X: vertices @ 4433
+    0x02, 0x00, 0x00, 0x02, 0x01, 0x00, 0x01, 0x00, 0x00, 0x01, 0x01, 0x00, 0x02, 0x00, 0x02, 0x02,
+    0x01, 0x02, 0x03, 0x00, 0x02, 0x03, 0x01, 0x02, 0x03, 0x00, 0x01, 0x03, 0x01, 0x01, 0x01, 0x00,
+    0x03, 0x01, 0x01, 0x03, 0x01, 0x01, 0x02, 0x02, 0x00, 0x03, 0x02, 0x01, 0x03, 0x00, 0x00, 0x02,
+    0x00, 0x01, 0x02, 0x00, 0x00, 0x01, 0x00, 0x01, 0x01, 0x01, 0x00, 0x02, 0x01, 0x00, 0x01, 0x01,
+    0x01, 0x01, 0x02, 0x00, 0x01, 0x02, 0x01, 0x01,
+    // X: edges @ 4505
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x16, 0x01, 0x03, 0x01, 0x17, 0x02, 0x03, 0x02, 0x14, 0x03, 0x15,
+    0x04, 0x05, 0x04, 0x06, 0x04, 0x0d, 0x05, 0x07, 0x05, 0x0e, 0x06, 0x07, 0x06, 0x08, 0x07, 0x09,
+    0x08, 0x09, 0x08, 0x16, 0x09, 0x17, 0x0a, 0x0b, 0x0a, 0x0d, 0x0a, 0x13, 0x0b, 0x0c, 0x0b, 0x0e,
+    0x0c, 0x10, 0x0c, 0x13, 0x0d, 0x0e, 0x0f, 0x10, 0x0f, 0x11, 0x0f, 0x13, 0x10, 0x12, 0x11, 0x12,
+    0x11, 0x14, 0x12, 0x15, 0x14, 0x15, 0x16, 0x17,
+    // X: face vertices @ 4577
+    0x14, 0x15, 0x03, 0x02, 0x02, 0x03, 0x01, 0x00, 0x00, 0x01, 0x17, 0x16, 0x16, 0x17, 0x09, 0x08,
+    0x08, 0x09, 0x07, 0x06, 0x06, 0x07, 0x05, 0x04, 0x0a, 0x0b, 0x0c, 0x13, 0x04, 0x05, 0x0e, 0x0d,
+    0x0d, 0x0e, 0x0b, 0x0a, 0x00, 0x16, 0x08, 0x06, 0x04, 0x0d, 0x0a, 0x13, 0x0f, 0x11, 0x14, 0x02,
+    0x0f, 0x10, 0x12, 0x11, 0x11, 0x12, 0x15, 0x14, 0x13, 0x0c, 0x10, 0x0f, 0x03, 0x15, 0x12, 0x10,
+    0x0c, 0x0b, 0x0e, 0x05, 0x07, 0x09, 0x17, 0x01,
+    // X: face vertex counts @ 4649
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0c, 0x04, 0x04, 0x04, 0x0c,
+    // Y: vertices @ 4663
+    0x04, 0x01, 0x01, 0x04, 0x01, 0x00, 0x04, 0x02, 0x01, 0x04, 0x02, 0x00, 0x01, 0x00, 0x01, 0x01,
+    0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x01, 0x00, 0x01, 0x01,
+    0x01, 0x00, 0x02, 0x01, 0x00, 0x02, 0x00, 0x01, 0x01, 0x00, 0x02, 0x01, 0x00, 0x02, 0x01, 0x01,
+    // Y: edges @ 4711
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x0f, 0x01, 0x03, 0x01, 0x0e, 0x02, 0x03, 0x02, 0x0b, 0x03, 0x0c,
+    0x04, 0x05, 0x04, 0x06, 0x04, 0x0a, 0x05, 0x07, 0x05, 0x0d, 0x06, 0x07, 0x06, 0x0f, 0x07, 0x0e,
+    0x08, 0x09, 0x08, 0x0a, 0x08, 0x0b, 0x09, 0x0c, 0x09, 0x0d, 0x0a, 0x0d, 0x0b, 0x0c, 0x0e, 0x0f,
+    // Y: face vertices @ 4759
+    0x00, 0x01, 0x03, 0x02, 0x04, 0x05, 0x07, 0x06, 0x06, 0x07, 0x0e, 0x0f, 0x0a, 0x0d, 0x05, 0x04,
+    0x08, 0x09, 0x0d, 0x0a, 0x0b, 0x0c, 0x09, 0x08, 0x01, 0x0e, 0x07, 0x05, 0x0d, 0x09, 0x0c, 0x03,
+    0x01, 0x00, 0x0f, 0x0e, 0x02, 0x03, 0x0c, 0x0b, 0x00, 0x02, 0x0b, 0x08, 0x0a, 0x04, 0x06, 0x0f,
+    // Y: face vertex counts @ 4807
+    0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x08, 0x04, 0x04, 0x08,
+    // Z: vertices @ 4817
+    0x02, 0x00, 0x03, 0x02, 0x01, 0x03, 0x02, 0x00, 0x02, 0x03, 0x00, 0x03, 0x03, 0x01, 0x03, 0x02,
+    0x01, 0x02, 0x03, 0x00, 0x01, 0x03, 0x01, 0x01, 0x00, 0x00, 0x02, 0x00, 0x01, 0x02, 0x00, 0x00,
+    0x00, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x01, 0x01, 0x00,
+    // Z: edges @ 4865
+    0x00, 0x01, 0x00, 0x02, 0x00, 0x03, 0x01, 0x04, 0x01, 0x05, 0x02, 0x05, 0x02, 0x08, 0x03, 0x04,
+    0x03, 0x06, 0x04, 0x07, 0x05, 0x09, 0x06, 0x07, 0x06, 0x0c, 0x07, 0x0d, 0x08, 0x09, 0x08, 0x0a,
+    0x09, 0x0b, 0x0a, 0x0b, 0x0a, 0x0e, 0x0b, 0x0f, 0x0c, 0x0d, 0x0c, 0x0e, 0x0d, 0x0f, 0x0e, 0x0f,
+    // Z: face vertices @ 4913
+    0x00, 0x01, 0x05, 0x02, 0x03, 0x04, 0x01, 0x00, 0x08, 0x09, 0x0b, 0x0a, 0x06, 0x03, 0x00, 0x02,
+    0x08, 0x0a, 0x0e, 0x0c, 0x02, 0x05, 0x09, 0x08, 0x0a, 0x0b, 0x0f, 0x0e, 0x0e, 0x0f, 0x0d, 0x0c,
+    0x07, 0x04, 0x03, 0x06, 0x07, 0x06, 0x0c, 0x0d, 0x05, 0x01, 0x04, 0x07, 0x0d, 0x0f, 0x0b, 0x09,
+    // Z: face vertex counts @ 4961
+    0x04, 0x04, 0x04, 0x08, 0x04, 0x04, 0x04, 0x04, 0x04, 0x08,
 };
 
 const pentacube_data_t pentacube_data[PENTACUBE_COUNT] = {
     {
-        .vertices = (const float *)vertices_A,
+        .vertices = pentacube_blob + 0,
         .vertex_count = 20,
-        .edges = edges_A,
+        .edges = pentacube_blob + 60,
         .edge_count = 30,
-        .face_vertices = face_vertices_A,
-        .face_vertex_counts = face_vertex_counts_A,
+        .face_vertices = pentacube_blob + 120,
+        .face_vertex_counts = pentacube_blob + 180,
         .face_count = 12,
         .name = "A"
     },
     {
-        .vertices = (const float *)vertices_B,
+        .vertices = pentacube_blob + 192,
         .vertex_count = 18,
-        .edges = edges_B,
+        .edges = pentacube_blob + 246,
         .edge_count = 28,
-        .face_vertices = face_vertices_B,
-        .face_vertex_counts = face_vertex_counts_B,
+        .face_vertices = pentacube_blob + 302,
+        .face_vertex_counts = pentacube_blob + 358,
         .face_count = 12,
         .name = "B"
     },
     {
-        .vertices = (const float *)vertices_E,
+        .vertices = pentacube_blob + 370,
         .vertex_count = 19,
-        .edges = edges_E,
+        .edges = pentacube_blob + 427,
         .edge_count = 29,
-        .face_vertices = face_vertices_E,
-        .face_vertex_counts = face_vertex_counts_E,
+        .face_vertices = pentacube_blob + 485,
+        .face_vertex_counts = pentacube_blob + 538,
         .face_count = 11,
         .name = "E"
     },
     {
-        .vertices = (const float *)vertices_E_p,
+        .vertices = pentacube_blob + 549,
         .vertex_count = 19,
-        .edges = edges_E_p,
+        .edges = pentacube_blob + 606,
         .edge_count = 29,
-        .face_vertices = face_vertices_E_p,
-        .face_vertex_counts = face_vertex_counts_E_p,
+        .face_vertices = pentacube_blob + 664,
+        .face_vertex_counts = pentacube_blob + 717,
         .face_count = 11,
         .name = "E'"
     },
     {
-        .vertices = (const float *)vertices_F,
+        .vertices = pentacube_blob + 728,
         .vertex_count = 20,
-        .edges = edges_F,
+        .edges = pentacube_blob + 788,
         .edge_count = 30,
-        .face_vertices = face_vertices_F,
-        .face_vertex_counts = face_vertex_counts_F,
+        .face_vertices = pentacube_blob + 848,
+        .face_vertex_counts = pentacube_blob + 908,
         .face_count = 12,
         .name = "F"
     },
     {
-        .vertices = (const float *)vertices_G,
+        .vertices = pentacube_blob + 920,
         .vertex_count = 19,
-        .edges = edges_G,
+        .edges = pentacube_blob + 977,
         .edge_count = 29,
-        .face_vertices = face_vertices_G,
-        .face_vertex_counts = face_vertex_counts_G,
+        .face_vertices = pentacube_blob + 1035,
+        .face_vertex_counts = pentacube_blob + 1093,
         .face_count = 12,
         .name = "G"
     },
     {
-        .vertices = (const float *)vertices_G_p,
+        .vertices = pentacube_blob + 1105,
         .vertex_count = 19,
-        .edges = edges_G_p,
+        .edges = pentacube_blob + 1162,
         .edge_count = 29,
-        .face_vertices = face_vertices_G_p,
-        .face_vertex_counts = face_vertex_counts_G_p,
+        .face_vertices = pentacube_blob + 1220,
+        .face_vertex_counts = pentacube_blob + 1278,
         .face_count = 12,
         .name = "G'"
     },
     {
-        .vertices = (const float *)vertices_H,
+        .vertices = pentacube_blob + 1290,
         .vertex_count = 19,
-        .edges = edges_H,
+        .edges = pentacube_blob + 1347,
         .edge_count = 29,
-        .face_vertices = face_vertices_H,
-        .face_vertex_counts = face_vertex_counts_H,
+        .face_vertices = pentacube_blob + 1405,
+        .face_vertex_counts = pentacube_blob + 1463,
         .face_count = 12,
         .name = "H"
     },
     {
-        .vertices = (const float *)vertices_H_p,
+        .vertices = pentacube_blob + 1475,
         .vertex_count = 19,
-        .edges = edges_H_p,
+        .edges = pentacube_blob + 1532,
         .edge_count = 29,
-        .face_vertices = face_vertices_H_p,
-        .face_vertex_counts = face_vertex_counts_H_p,
+        .face_vertices = pentacube_blob + 1590,
+        .face_vertex_counts = pentacube_blob + 1648,
         .face_count = 12,
         .name = "H'"
     },
     {
-        .vertices = (const float *)vertices_I,
+        .vertices = pentacube_blob + 1660,
         .vertex_count = 8,
-        .edges = edges_I,
+        .edges = pentacube_blob + 1684,
         .edge_count = 12,
-        .face_vertices = face_vertices_I,
-        .face_vertex_counts = face_vertex_counts_I,
+        .face_vertices = pentacube_blob + 1708,
+        .face_vertex_counts = pentacube_blob + 1732,
         .face_count = 6,
         .name = "I"
     },
     {
-        .vertices = (const float *)vertices_J,
+        .vertices = pentacube_blob + 1738,
         .vertex_count = 19,
-        .edges = edges_J,
+        .edges = pentacube_blob + 1795,
         .edge_count = 23,
-        .face_vertices = face_vertices_J,
-        .face_vertex_counts = face_vertex_counts_J,
+        .face_vertices = pentacube_blob + 1841,
+        .face_vertex_counts = pentacube_blob + 1887,
         .face_count = 10,
         .name = "J"
     },
     {
-        .vertices = (const float *)vertices_J_p,
+        .vertices = pentacube_blob + 1897,
         .vertex_count = 19,
-        .edges = edges_J_p,
+        .edges = pentacube_blob + 1954,
         .edge_count = 23,
-        .face_vertices = face_vertices_J_p,
-        .face_vertex_counts = face_vertex_counts_J_p,
+        .face_vertices = pentacube_blob + 2000,
+        .face_vertex_counts = pentacube_blob + 2046,
         .face_count = 10,
         .name = "J'"
     },
     {
-        .vertices = (const float *)vertices_K,
+        .vertices = pentacube_blob + 2056,
         .vertex_count = 24,
-        .edges = edges_K,
+        .edges = pentacube_blob + 2128,
         .edge_count = 34,
-        .face_vertices = face_vertices_K,
-        .face_vertex_counts = face_vertex_counts_K,
+        .face_vertices = pentacube_blob + 2196,
+        .face_vertex_counts = pentacube_blob + 2264,
         .face_count = 12,
         .name = "K"
     },
     {
-        .vertices = (const float *)vertices_L,
+        .vertices = pentacube_blob + 2276,
         .vertex_count = 12,
-        .edges = edges_L,
+        .edges = pentacube_blob + 2312,
         .edge_count = 18,
-        .face_vertices = face_vertices_L,
-        .face_vertex_counts = face_vertex_counts_L,
+        .face_vertices = pentacube_blob + 2348,
+        .face_vertex_counts = pentacube_blob + 2384,
         .face_count = 8,
         .name = "L"
     },
     {
-        .vertices = (const float *)vertices_M,
+        .vertices = pentacube_blob + 2392,
         .vertex_count = 24,
-        .edges = edges_M,
+        .edges = pentacube_blob + 2464,
         .edge_count = 38,
-        .face_vertices = face_vertices_M,
-        .face_vertex_counts = face_vertex_counts_M,
+        .face_vertices = pentacube_blob + 2540,
+        .face_vertex_counts = pentacube_blob + 2616,
         .face_count = 16,
         .name = "M"
     },
     {
-        .vertices = (const float *)vertices_N,
+        .vertices = pentacube_blob + 2632,
         .vertex_count = 16,
-        .edges = edges_N,
+        .edges = pentacube_blob + 2680,
         .edge_count = 24,
-        .face_vertices = face_vertices_N,
-        .face_vertex_counts = face_vertex_counts_N,
+        .face_vertices = pentacube_blob + 2728,
+        .face_vertex_counts = pentacube_blob + 2776,
         .face_count = 10,
         .name = "N"
     },
     {
-        .vertices = (const float *)vertices_P,
+        .vertices = pentacube_blob + 2786,
         .vertex_count = 12,
-        .edges = edges_P,
+        .edges = pentacube_blob + 2822,
         .edge_count = 18,
-        .face_vertices = face_vertices_P,
-        .face_vertex_counts = face_vertex_counts_P,
+        .face_vertices = pentacube_blob + 2858,
+        .face_vertex_counts = pentacube_blob + 2894,
         .face_count = 8,
         .name = "P"
     },
     {
-        .vertices = (const float *)vertices_Q,
+        .vertices = pentacube_blob + 2902,
         .vertex_count = 14,
-        .edges = edges_Q,
+        .edges = pentacube_blob + 2944,
         .edge_count = 21,
-        .face_vertices = face_vertices_Q,
-        .face_vertex_counts = face_vertex_counts_Q,
+        .face_vertices = pentacube_blob + 2986,
+        .face_vertex_counts = pentacube_blob + 3028,
         .face_count = 9,
         .name = "Q"
     },
     {
-        .vertices = (const float *)vertices_R,
+        .vertices = pentacube_blob + 3037,
         .vertex_count = 20,
-        .edges = edges_R,
+        .edges = pentacube_blob + 3097,
         .edge_count = 32,
-        .face_vertices = face_vertices_R,
-        .face_vertex_counts = face_vertex_counts_R,
+        .face_vertices = pentacube_blob + 3161,
+        .face_vertex_counts = pentacube_blob + 3225,
         .face_count = 14,
         .name = "R"
     },
     {
-        .vertices = (const float *)vertices_R_p,
+        .vertices = pentacube_blob + 3239,
         .vertex_count = 20,
-        .edges = edges_R_p,
+        .edges = pentacube_blob + 3299,
         .edge_count = 32,
-        .face_vertices = face_vertices_R_p,
-        .face_vertex_counts = face_vertex_counts_R_p,
+        .face_vertices = pentacube_blob + 3363,
+        .face_vertex_counts = pentacube_blob + 3427,
         .face_count = 14,
         .name = "R'"
     },
     {
-        .vertices = (const float *)vertices_S,
+        .vertices = pentacube_blob + 3441,
         .vertex_count = 16,
-        .edges = edges_S,
+        .edges = pentacube_blob + 3489,
         .edge_count = 24,
-        .face_vertices = face_vertices_S,
-        .face_vertex_counts = face_vertex_counts_S,
+        .face_vertices = pentacube_blob + 3537,
+        .face_vertex_counts = pentacube_blob + 3585,
         .face_count = 10,
         .name = "S"
     },
     {
-        .vertices = (const float *)vertices_S_p,
+        .vertices = pentacube_blob + 3595,
         .vertex_count = 16,
-        .edges = edges_S_p,
+        .edges = pentacube_blob + 3643,
         .edge_count = 24,
-        .face_vertices = face_vertices_S_p,
-        .face_vertex_counts = face_vertex_counts_S_p,
+        .face_vertices = pentacube_blob + 3691,
+        .face_vertex_counts = pentacube_blob + 3739,
         .face_count = 10,
         .name = "S'"
     },
     {
-        .vertices = (const float *)vertices_T,
+        .vertices = pentacube_blob + 3749,
         .vertex_count = 24,
-        .edges = edges_T,
+        .edges = pentacube_blob + 3821,
         .edge_count = 32,
-        .face_vertices = face_vertices_T,
-        .face_vertex_counts = face_vertex_counts_T,
+        .face_vertices = pentacube_blob + 3885,
+        .face_vertex_counts = pentacube_blob + 3949,
         .face_count = 10,
         .name = "T"
     },
     {
-        .vertices = (const float *)vertices_U,
+        .vertices = pentacube_blob + 3959,
         .vertex_count = 16,
-        .edges = edges_U,
+        .edges = pentacube_blob + 4007,
         .edge_count = 24,
-        .face_vertices = face_vertices_U,
-        .face_vertex_counts = face_vertex_counts_U,
+        .face_vertices = pentacube_blob + 4055,
+        .face_vertex_counts = pentacube_blob + 4103,
         .face_count = 10,
         .name = "U"
     },
     {
-        .vertices = (const float *)vertices_V,
+        .vertices = pentacube_blob + 4113,
         .vertex_count = 16,
-        .edges = edges_V,
+        .edges = pentacube_blob + 4161,
         .edge_count = 18,
-        .face_vertices = face_vertices_V,
-        .face_vertex_counts = face_vertex_counts_V,
+        .face_vertices = pentacube_blob + 4197,
+        .face_vertex_counts = pentacube_blob + 4233,
         .face_count = 8,
         .name = "V"
     },
     {
-        .vertices = (const float *)vertices_W,
+        .vertices = pentacube_blob + 4241,
         .vertex_count = 20,
-        .edges = edges_W,
+        .edges = pentacube_blob + 4301,
         .edge_count = 30,
-        .face_vertices = face_vertices_W,
-        .face_vertex_counts = face_vertex_counts_W,
+        .face_vertices = pentacube_blob + 4361,
+        .face_vertex_counts = pentacube_blob + 4421,
         .face_count = 12,
         .name = "W"
     },
     {
-        .vertices = (const float *)vertices_X,
+        .vertices = pentacube_blob + 4433,
         .vertex_count = 24,
-        .edges = edges_X,
+        .edges = pentacube_blob + 4505,
         .edge_count = 36,
-        .face_vertices = face_vertices_X,
-        .face_vertex_counts = face_vertex_counts_X,
+        .face_vertices = pentacube_blob + 4577,
+        .face_vertex_counts = pentacube_blob + 4649,
         .face_count = 14,
         .name = "X"
     },
     {
-        .vertices = (const float *)vertices_Y,
+        .vertices = pentacube_blob + 4663,
         .vertex_count = 16,
-        .edges = edges_Y,
+        .edges = pentacube_blob + 4711,
         .edge_count = 24,
-        .face_vertices = face_vertices_Y,
-        .face_vertex_counts = face_vertex_counts_Y,
+        .face_vertices = pentacube_blob + 4759,
+        .face_vertex_counts = pentacube_blob + 4807,
         .face_count = 10,
         .name = "Y"
     },
     {
-        .vertices = (const float *)vertices_Z,
+        .vertices = pentacube_blob + 4817,
         .vertex_count = 16,
-        .edges = edges_Z,
+        .edges = pentacube_blob + 4865,
         .edge_count = 24,
-        .face_vertices = face_vertices_Z,
-        .face_vertex_counts = face_vertex_counts_Z,
+        .face_vertices = pentacube_blob + 4913,
+        .face_vertex_counts = pentacube_blob + 4961,
         .face_count = 10,
         .name = "Z"
     },
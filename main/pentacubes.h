@@ -1,15 +1,19 @@
 #ifndef PENTACUBES_H
 #define PENTACUBES_H
 
+#include <stdint.h>
+
 #define PENTACUBE_COUNT 29
 
+// All arrays point into one packed byte blob: every coordinate, index and
+// count of a pentacube fits in a uint8_t.
 typedef struct {
-    const float *vertices;      // Pointer to vertex array (x,y,z triplets)
+    const uint8_t *vertices;     // Pointer to vertex array (x,y,z triplets)
     int vertex_count;            // Number of vertices
-    const int *edges;            // Pointer to edge array (vertex index pairs)
-    int edge_count;              // Number of edges (total ints / 2)
-    const int *face_vertices;    // Pointer to face vertex indices
-    const int *face_vertex_counts; // Pointer to array of vertex counts per face
+    const uint8_t *edges;        // Pointer to edge array (vertex index pairs)
+    int edge_count;              // Number of edges (total bytes / 2)
+    const uint8_t *face_vertices;    // Pointer to face vertex indices
+    const uint8_t *face_vertex_counts; // Pointer to array of vertex counts per face
     int face_count;              // Number of faces
     const char *name;            // Name of the pentacube
 } pentacube_data_t;
@@ -1,341 +1,346 @@
-import json
+import hashlib
+import io
+import os
 import bpy
-import math
+import numpy as np
 from pathlib import Path
 
-def are_parallel_or_perpendicular(v1, v2):
-    """Check if edge is parallel to one of the main axes (cube edge)"""
-    dx = abs(v1[0] - v2[0])
-    dy = abs(v1[1] - v2[1])
-    dz = abs(v1[2] - v2[2])
-    
-    non_zero = sum([1 if d > 0.001 else 0 for d in [dx, dy, dz]])
-    return non_zero == 1
+# Bump whenever the generated C output changes, to force regeneration
+GENERATOR_VERSION = 2
+
+# Pentacube object names, in the order they appear in pentacube_data[]
+PENTACUBES_ORDERED = ('A', 'B', 'E', 'E\'', 'F', 'G', 'G\'', 'H', 'H\'', 'I', 'J', 'J\'', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'R\'', 'S', 'S\'', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z')
+PENTACUBE_SET = frozenset(PENTACUBES_ORDERED)
 
-def round_coord(val, threshold=1e-5):
-    """Round coordinates close to integers"""
-    if abs(val) < threshold:
-        return 0
-    rounded = round(val)
-    if abs(val - rounded) < threshold:
-        return int(rounded)
-    return val
+# Precompiled row templates for the generated C source
+_BYTE_FMT = "0x{:02x}".format
+_LINE_FMT = "    {},\n".format
+_DATA_FMT = """    {{
+        .vertices = pentacube_blob + {vert_offset},
+        .vertex_count = {vert_count},
+        .edges = pentacube_blob + {edge_offset},
+        .edge_count = {edge_count},
+        .face_vertices = pentacube_blob + {face_vertex_offset},
+        .face_vertex_counts = pentacube_blob + {face_count_offset},
+        .face_count = {face_count},
+        .name = "{name}"
+    }},
+""".format
 
-def compute_face_normal(vertices, vertex_indices):
-    """Compute face normal using Newell's method (works for non-planar polygons)"""
-    normal = [0, 0, 0]
-    n = len(vertex_indices)
+def format_blob_bytes(values):
+    """
+    Format a sequence of small non-negative ints as rows of 16 C byte
+    literals. Every coordinate, index and count must fit in a uint8_t.
+    """
+    data = np.asarray(values, dtype=np.int64).ravel()
+    if data.size and (data.min() < 0 or data.max() > 255):
+        raise ValueError(f"value out of uint8_t range: {data.min()}..{data.max()}")
     
-    for i in range(n):
-        v1 = vertices[vertex_indices[i]]
-        v2 = vertices[vertex_indices[(i + 1) % n]]
-        
-        normal[0] += (v1[1] - v2[1]) * (v1[2] + v2[2])
-        normal[1] += (v1[2] - v2[2]) * (v1[0] + v2[0])
-        normal[2] += (v1[0] - v2[0]) * (v1[1] + v2[1])
+    rows = [', '.join(map(_BYTE_FMT, data[i:i+16].tolist())) for i in range(0, data.size, 16)]
+    return ''.join(map(_LINE_FMT, rows)), data.size
+
+def generate_cube_edges_only(V_arr, faces):
+    """
+    Collect the unique cube edges (axis-aligned face boundary segments).
+    Returns a flat [v1, v2, v1, v2, ...] list sorted by vertex pair.
+    """
+    # Consecutive vertex pairs of every face, wrapping each face around
+    # with a shifted copy of its vertex list
+    starts = []
+    ends = []
+    for face in faces:
+        face_verts = face['vertices']
+        starts += face_verts
+        ends += face_verts[1:] + face_verts[:1]
     
-    # Normalize
-    length = math.sqrt(sum(n*n for n in normal))
-    if length > 0.001:
-        normal = [n / length for n in normal]
+    if not starts:
+        return []
+    
+    pairs = np.array([starts, ends], dtype=np.int32)
+    
+    # Cube edges differ along exactly one axis; coordinates are
+    # integers, so exact inequality replaces the abs/epsilon test
+    mask = (V_arr[pairs[0]] != V_arr[pairs[1]]).sum(axis=1) == 1
+    
+    # Pack each undirected edge into one key: (min << 16) | max
+    a = np.minimum(pairs[0], pairs[1]).astype(np.uint32)
+    b = np.maximum(pairs[0], pairs[1]).astype(np.uint32)
+    keys = ((a << 16) | b)[mask]
+    if keys.size == 0:
+        return []
+    
+    # Sort the packed keys in place and drop adjacent duplicates
+    keys.sort()
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
     
-    return normal
+    edges = np.empty(keys.size * 2, dtype=np.int32)
+    edges[0::2] = keys >> 16
+    edges[1::2] = keys & 0xFFFF
+    return edges.tolist()
 
-def ensure_ccw_winding(vertices, vertex_indices, blender_normal):
+def compute_face_normals(V_arr, face_indices):
     """
-    Ensure face vertices are in CCW order when viewed from outside.
-    Uses Blender's face normal as reference.
+    Compute all face normals of a mesh at once using Newell's method
+    (works for non-planar polygons). Faces are flattened into one loop
+    array and the per-face sums are taken with np.add.reduceat.
     """
-    # Compute current winding normal using Newell's method
-    computed_normal = compute_face_normal(vertices, vertex_indices)
+    if not face_indices:
+        return np.zeros((0, 3))
     
-    # Dot product with Blender's normal
-    dot = sum(computed_normal[i] * blender_normal[i] for i in range(3))
+    counts = np.fromiter(map(len, face_indices), dtype=np.int64, count=len(face_indices))
+    starts = np.cumsum(counts) - counts
+    idx = np.concatenate(face_indices).astype(np.int64)
     
-    # If dot < 0, vertices are in wrong order
-    if dot < -0.1:
-        vertex_indices = list(reversed(vertex_indices))
+    # Index of the next vertex in the same face, wrapping at the face end
+    nxt = np.arange(1, idx.size + 1)
+    nxt[starts + counts - 1] = starts
     
-    return vertex_indices
-
-# ===== PASS 1: Export and Collect Metadata =====
-
-blend_file = Path(bpy.data.filepath).absolute()
-script_dir = blend_file.parent
-output_file = script_dir.parent / "main" / "pentacubes.c"
-
-print(f"Blend file: {blend_file}")
-print(f"Output file: {output_file}\n")
-
-output_file.parent.mkdir(parents=True, exist_ok=True)
-
-# Export from Blender
-blender_export = {}
-
-for obj in bpy.data.objects:
-    if obj.type != 'MESH':
-        continue
+    V = V_arr[idx].astype(np.float64)
+    Vn = V[nxt]
+    d = V - Vn
+    s = V + Vn
+    
+    terms = np.stack([
+        d[:, 1] * s[:, 2],
+        d[:, 2] * s[:, 0],
+        d[:, 0] * s[:, 1]
+    ], axis=1)
+    normals = np.add.reduceat(terms, starts, axis=0)
     
+    # Normalize
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.where(lengths > 0.001, normals / np.maximum(lengths, 0.001), normals)
+
+def extract_mesh(obj):
+    """
+    Bulk-copy a mesh object's data straight from Blender's buffers into
+    NumPy with foreach_get. Returns (origin, vertices, faces).
+    """
     mesh = obj.data
-    vertices = [[v.co.x, v.co.y, v.co.z] for v in mesh.vertices]
-    edges = [[e.vertices[0], e.vertices[1]] for e in mesh.edges]
+    
+    vertices = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vertices)
+    vertices = vertices.reshape(-1, 3)
+    
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    normals = normals.reshape(-1, 3)
+    
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
     
     faces = []
-    for face in mesh.polygons:
+    for start, total, normal in zip(loop_starts.tolist(), loop_totals.tolist(), normals):
         faces.append({
-            "vertices": list(face.vertices),
-            "normal": [face.normal.x, face.normal.y, face.normal.z]
+            "vertices": loop_verts[start:start + total].tolist(),
+            "normal": normal
         })
     
-    origin = [obj.location.x, obj.location.y, obj.location.z]
+    origin = np.array(obj.location, dtype=np.float64)
     
-    blender_export[obj.name] = {
-        "origin": origin,
-        "vertices": vertices,
-        "edges": edges,
-        "faces": faces
-    }
-
-print("✓ PASS 1: Exported from Blender")
-
-# ===== PASS 2: Validate and Fix Winding =====
-
-pentacubes_ordered = ['A', 'B', 'E', 'E\'', 'F', 'G', 'G\'', 'H', 'H\'', 'I', 'J', 'J\'', 'K', 'L', 'M', 'N', 'P', 'Q', 'R', 'R\'', 'S', 'S\'', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z']
+    return origin, vertices, faces
 
-pentacubes_validated = {}
-winding_issues = {}
-
-for name in pentacubes_ordered:
-    if name not in blender_export:
-        print(f"⚠ {name}: NOT FOUND in Blender export")
-        continue
-    
-    obj = blender_export[name]
-    origin = obj['origin']
-    vertices = obj['vertices']
-    faces = obj['faces']
-    
-    # Adjust vertices relative to origin
-    adjusted_verts = []
-    for v in vertices:
-        adjusted_verts.append([
-            round_coord(v[0] - origin[0]),
-            round_coord(v[1] - origin[1]),
-            round_coord(v[2] - origin[2])
-        ])
+def process_pentacube(origin, vertices, faces):
+    """
+    Validate one pentacube: shift it to positive integer coordinates, fix
+    face winding and collect its cube edges. Touches no Blender data.
+    """
+    # Adjust vertices relative to origin, snapping near-integers
+    V = np.asarray(vertices, dtype=np.float64) - np.asarray(origin, dtype=np.float64)
+    R = np.round(V)
+    V = np.where(np.abs(V - R) < 1e-5, R, V)
     
     # Shift to positive coordinates
-    min_x = min(v[0] for v in adjusted_verts)
-    min_y = min(v[1] for v in adjusted_verts)
-    min_z = min(v[2] for v in adjusted_verts)
-    
-    positive_verts = []
-    for v in adjusted_verts:
-        positive_verts.append([
-            int(v[0] - min_x),
-            int(v[1] - min_y),
-            int(v[2] - min_z)
-        ])
+    V -= V.min(axis=0)
+    # Coordinates are small non-negative integers (0..5), so one compact
+    # array is shared by all per-face routines below
+    V_arr = V.astype(np.int8)
+    positive_verts = V_arr.tolist()
     
     # Fix winding for all faces
     fixed_faces = []
     winding_flips = 0
+    max_face_verts = 0
     
-    for face in faces:
+    # Ensure CCW winding when viewed from outside, using Blender's
+    # face normals as reference. A face is flipped when its computed
+    # normal points away from Blender's.
+    computed_normals = compute_face_normals(V_arr, [face['vertices'] for face in faces])
+    blender_normals = np.asarray([face['normal'] for face in faces], dtype=np.float64).reshape(-1, 3)
+    flips = ((computed_normals * blender_normals).sum(axis=1) < -0.1).tolist()
+    
+    for face, flip in zip(faces, flips):
         vertex_indices = face['vertices']
         blender_normal = face['normal']
         
-        # Check current winding
-        computed_normal = compute_face_normal(positive_verts, vertex_indices)
-        dot_before = sum(computed_normal[i] * blender_normal[i] for i in range(3))
-        
-        # Fix if needed
-        fixed_indices = ensure_ccw_winding(positive_verts, vertex_indices, blender_normal)
-        
-        # Verify fix
-        computed_normal = compute_face_normal(positive_verts, fixed_indices)
-        dot_after = sum(computed_normal[i] * blender_normal[i] for i in range(3))
-        
-        if dot_before < -0.1 and dot_after > -0.1:
+        if flip:
+            fixed_indices = list(reversed(vertex_indices))
             winding_flips += 1
+        else:
+            fixed_indices = vertex_indices
         
         fixed_faces.append({
             "vertices": fixed_indices,
             "vert_count": len(fixed_indices),
             "normal": blender_normal
         })
+        max_face_verts = max(max_face_verts, len(fixed_indices))
     
-    if winding_flips > 0:
-        winding_issues[name] = winding_flips
+    # Edges only depend on the validated geometry, compute them once here
+    edges = generate_cube_edges_only(V_arr, fixed_faces)
     
-    pentacubes_validated[name] = {
+    return {
         'vertices': positive_verts,
         'faces': fixed_faces,
+        'edges': edges,
         'vert_count': len(positive_verts),
-        'face_count': len(fixed_faces)
+        'edge_count': len(edges) // 2,
+        'face_count': len(fixed_faces),
+        'winding_flips': winding_flips,
+        'max_face_verts': max_face_verts
     }
 
-print(f"✓ PASS 2: Validated {len(pentacubes_validated)} pentacubes")
-if winding_issues:
-    print(f"  Winding fixes applied:")
-    for name, count in sorted(winding_issues.items()):
-        print(f"    {name}: {count} faces flipped")
+def compute_source_hash():
+    """Hash the exported mesh names together with the generator version"""
+    names = sorted(obj.name for obj in bpy.data.objects if obj.type == 'MESH')
+    key = '\n'.join(names + [str(GENERATOR_VERSION)])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+def is_up_to_date(blend_file, output_file, source_hash):
+    """
+    Make-style check: the C file is newer than the saved .blend, there are
+    no unsaved edits and it was generated from the same meshes/version.
+    """
+    if os.environ.get("FORCE_REGEN", "") not in ("", "0") or bpy.data.is_dirty:
+        return False
+    if not blend_file.is_file() or not output_file.is_file():
+        return False
+    if output_file.stat().st_mtime < blend_file.stat().st_mtime:
+        return False
+    
+    # mtime alone is unreliable (e.g. after a checkout), also match the hash
+    with open(output_file) as f:
+        for line in f:
+            if not line.startswith("//"):
+                break
+            if line.startswith("// Source hash: "):
+                return line.split(":", 1)[1].strip() == source_hash
+    return False
+
+def main():
+    # ===== Setup =====
+
+    blend_file = Path(bpy.data.filepath).absolute()
+    script_dir = blend_file.parent
+    output_file = script_dir.parent / "main" / "pentacubes.c"
+
+    print(f"Blend file: {blend_file}")
+    print(f"Output file: {output_file}\n")
+
+    source_hash = compute_source_hash()
+    if is_up_to_date(blend_file, output_file, source_hash):
+        print("✓ Up to date, nothing to do (set FORCE_REGEN=1 to override)")
+        return
+    
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # ===== PASS 1: Export, Validate, Fix Winding and Generate C Code =====
+    # Each pentacube is read straight from its Blender object and validated.
+    # Its vertices, edges, face vertices and face vertex counts are then
+    # appended to one packed byte blob, in order, and its statistics are
+    # gathered as we go.
+
+    winding_issues = {}
+
+    blob_buf = io.StringIO()
+    blob_size = 0
+    data_buf = io.StringIO()
 
-# ===== PASS 3: Generate Optimized C Code =====
+    stats_lines = []
+    total_stats = {"verts": 0, "edges": 0, "faces": 0, "max_face": 0}
 
-with open(output_file, "w") as f:
-    f.write("// Auto-generated pentacube data from Blender export\n")
-    f.write("// DO NOT EDIT - regenerate from run_in_blender.py\n")
-    f.write("#include \"pentacubes.h\"\n\n")
+    by_name = {
+        obj.name: obj for obj in bpy.data.objects
+        if obj.type == 'MESH' and obj.name in PENTACUBE_SET
+    }
     
-    # Generate vertex arrays
-    for name in pentacubes_ordered:
-        if name not in pentacubes_validated:
-            continue
-        enum_name = name.replace("'", "_p")
-        verts = pentacubes_validated[name]['vertices']
-        f.write(f"static const float vertices_{enum_name}[][3] = {{\n")
-        for v in verts:
-            f.write(f"    {{{v[0]:.1f}f, {v[1]:.1f}f, {v[2]:.1f}f}},\n")
-        f.write("};\n\n")
+    # Resolve the exported pentacubes once, in display order
+    names = []
+    for name in PENTACUBES_ORDERED:
+        if name in by_name:
+            names.append(name)
+        else:
+            print(f"⚠ {name}: NOT FOUND in Blender export")
     
-    # Generate edge arrays
-    for name in pentacubes_ordered:
-        if name not in pentacubes_validated:
-            continue
-        enum_name = name.replace("'", "_p")
-        vertices = pentacubes_validated[name]['vertices']
-        faces = pentacubes_validated[name]['faces']
-        
-        edge_set = set()
-        for face in faces:
-            face_verts = face['vertices']
-            for i in range(len(face_verts)):
-                v1_idx = face_verts[i]
-                v2_idx = face_verts[(i + 1) % len(face_verts)]
-                
-                v1 = vertices[v1_idx]
-                v2 = vertices[v2_idx]
-                
-                if are_parallel_or_perpendicular(v1, v2):
-                    edge = tuple(sorted([v1_idx, v2_idx]))
-                    edge_set.add(edge)
+    for name in names:
+        data = process_pentacube(*extract_mesh(by_name[name]))
         
-        edges = []
-        for v1, v2 in sorted(edge_set):
-            edges.extend([v1, v2])
+        if data['winding_flips'] > 0:
+            winding_issues[name] = data['winding_flips']
         
-        f.write(f"static const int edges_{enum_name}[] = {{\n")
-        for i in range(0, len(edges), 16):
-            line = ', '.join(str(e) for e in edges[i:i+16])
-            f.write(f"    {line},\n")
-        f.write("};\n\n")
-    
-    # Generate face vertex arrays
-    for name in pentacubes_ordered:
-        if name not in pentacubes_validated:
-            continue
-        enum_name = name.replace("'", "_p")
-        faces = pentacubes_validated[name]['faces']
-        f.write(f"static const int face_vertices_{enum_name}[] = {{\n")
-        for face in faces:
-            verts = face['vertices']
-            line = ', '.join(str(v) for v in verts)
-            f.write(f"    {line},\n")
-        f.write("};\n\n")
-    
-    # Generate face vertex count arrays
-    for name in pentacubes_ordered:
-        if name not in pentacubes_validated:
-            continue
-        enum_name = name.replace("'", "_p")
-        faces = pentacubes_validated[name]['faces']
-        f.write(f"static const int face_vertex_counts_{enum_name}[] = {{\n")
-        for face in faces:
-            f.write(f"    {face['vert_count']},\n")
-        f.write("};\n\n")
-    
-    # Generate pentacube_data array
-    f.write("const pentacube_data_t pentacube_data[PENTACUBE_COUNT] = {\n")
-    
-    for name in pentacubes_ordered:
-        if name not in pentacubes_validated:
-            continue
-        enum_name = name.replace("'", "_p")
-        data = pentacubes_validated[name]
+        # Packed blob sections: x,y,z triplets, edge index pairs, face
+        # vertex indices, face vertex counts
+        sections = [
+            ('vert_offset', 'vertices', data['vertices']),
+            ('edge_offset', 'edges', data['edges']),
+            ('face_vertex_offset', 'face vertices', [i for face in data['faces'] for i in face['vertices']]),
+            ('face_count_offset', 'face vertex counts', [face['vert_count'] for face in data['faces']])
+        ]
+        offsets = {}
+        for key, label, values in sections:
+            rows, size = format_blob_bytes(values)
+            offsets[key] = blob_size
+            blob_buf.write(f"    // {name}: {label} @ {blob_size}\n")
+            blob_buf.write(rows)
+            blob_size += size
         
-        # Compute edge count
-        edge_set = set()
-        for face in data['faces']:
-            face_verts = face['vertices']
-            for i in range(len(face_verts)):
-                v1_idx = face_verts[i]
-                v2_idx = face_verts[(i + 1) % len(face_verts)]
-                
-                v1 = data['vertices'][v1_idx]
-                v2 = data['vertices'][v2_idx]
-                
-                if are_parallel_or_perpendicular(v1, v2):
-                    edge = tuple(sorted([v1_idx, v2_idx]))
-                    edge_set.add(edge)
+        # pentacube_data entry
+        data_buf.write(_DATA_FMT(name=name, **offsets, **data))
         
-        edge_count = len(edge_set)
+        # Statistics
+        total_stats["verts"] += data['vert_count']
+        total_stats["edges"] += data['edge_count']
+        total_stats["faces"] += data['face_count']
+        total_stats["max_face"] = max(total_stats["max_face"], data['max_face_verts'])
         
-        f.write(f"    {{\n")
-        f.write(f"        .vertices = (const float *)vertices_{enum_name},\n")
-        f.write(f"        .vertex_count = {data['vert_count']},\n")
-        f.write(f"        .edges = edges_{enum_name},\n")
-        f.write(f"        .edge_count = {edge_count},\n")
-        f.write(f"        .face_vertices = face_vertices_{enum_name},\n")
-        f.write(f"        .face_vertex_counts = face_vertex_counts_{enum_name},\n")
-        f.write(f"        .face_count = {data['face_count']},\n")
-        f.write(f"        .name = \"{name}\"\n")
-        f.write(f"    }},\n")
-    
-    f.write("};\n")
+        stats_lines.append(f"  {name:8s}: V={data['vert_count']:2d}, E={data['edge_count']:2d}, F={data['face_count']:2d}, MaxVpF={data['max_face_verts']:2d}")
 
-print(f"✓ PASS 3: Generated {output_file}")
+    print(f"✓ PASS 1: Exported and validated {len(names)} pentacubes")
+    if winding_issues:
+        print(f"  Winding fixes applied:")
+        for name, count in sorted(winding_issues.items()):
+            print(f"    {name}: {count} faces flipped")
 
-# ===== Statistics =====
+    # ===== PASS 2: Write C Code =====
 
-print("\n=== Pentacube Statistics ===")
-total_stats = {"verts": 0, "edges": 0, "faces": 0, "max_face": 0}
+    # Concatenate the section buffers and write the whole source at once
+    output_file.write_text(''.join([
+        "// Auto-generated pentacube data from Blender export\n",
+        "// DO NOT EDIT - regenerate from run_in_blender.py\n",
+        f"// Source hash: {source_hash}\n",
+        "#include \"pentacubes.h\"\n\n",
+        f"static const uint8_t pentacube_blob[{blob_size}] = {{\n",
+        blob_buf.getvalue(),
+        "};\n\n",
+        "const pentacube_data_t pentacube_data[PENTACUBE_COUNT] = {\n",
+        data_buf.getvalue(),
+        "};\n"
+    ]))
 
-for name in pentacubes_ordered:
-    if name not in pentacubes_validated:
-        continue
-    
-    data = pentacubes_validated[name]
-    vertices = data['vertices']
-    faces = data['faces']
-    
-    edge_set = set()
-    max_face_verts = 0
-    
-    for face in faces:
-        max_face_verts = max(max_face_verts, face['vert_count'])
-        face_verts = face['vertices']
-        for i in range(len(face_verts)):
-            v1_idx = face_verts[i]
-            v2_idx = face_verts[(i + 1) % len(face_verts)]
-            
-            v1 = vertices[v1_idx]
-            v2 = vertices[v2_idx]
-            
-            if are_parallel_or_perpendicular(v1, v2):
-                edge = tuple(sorted([v1_idx, v2_idx]))
-                edge_set.add(edge)
-    
-    edge_count = len(edge_set)
-    face_count = len(faces)
-    
-    total_stats["verts"] += data['vert_count']
-    total_stats["edges"] += edge_count
-    total_stats["faces"] += face_count
-    total_stats["max_face"] = max(total_stats["max_face"], max_face_verts)
-    
-    print(f"  {name:8s}: V={data['vert_count']:2d}, E={edge_count:2d}, F={face_count:2d}, MaxVpF={max_face_verts:2d}")
+    print(f"✓ PASS 2: Generated {output_file}")
+
+    # ===== Statistics =====
+
+    print("\n=== Pentacube Statistics ===")
+    print('\n'.join(stats_lines))
+
+    print(f"\n  TOTAL: {total_stats['verts']:3d} verts, {total_stats['edges']:3d} edges, {total_stats['faces']:3d} faces")
+    print(f"  Max vertices per face: {total_stats['max_face']}")
+    print(f"\n✓ All done!")
 
-print(f"\n  TOTAL: {total_stats['verts']:3d} verts, {total_stats['edges']:3d} edges, {total_stats['faces']:3d} faces")
-print(f"  Max vertices per face: {total_stats['max_face']}")
-print(f"\n✓ All done!")
\ No newline at end of file
+main()